@@ -4,13 +4,245 @@ Aggressive Kelly Criterion Calculator
 PHILOSOPHY: Push when confident, pull back when uncertain!
 """
 
+import bisect
+from collections import defaultdict, deque
+from dataclasses import dataclass
 import numpy as np
 import pandas as pd
-from typing import Dict
+from typing import Dict, List, Optional, Sequence
 import logging
 
 logger = logging.getLogger(__name__)
 
+# ===== THRESHOLD TABLES =====
+# Each factor is a sorted threshold array plus one multiplier per bucket:
+# MULTS[np.searchsorted(THRESHOLDS, x, side='right')] is the multiplier for
+# x, i.e. the bucket of the highest threshold x has reached.
+
+# Confidence: <60% skip ... 80%+ super confident
+CONF_THRESHOLDS = np.array([0.60, 0.65, 0.70, 0.75, 0.80])
+CONF_MULTS = np.array([0.0, 0.5, 1.0, 2.0, 2.5, 3.0])
+
+# Edge: <2% too small ... 15%+ huge
+EDGE_THRESHOLDS = np.array([0.02, 0.05, 0.10, 0.15])
+EDGE_MULTS = np.array([0.3, 1.0, 1.2, 1.5, 1.8])
+
+# Proven situational edge
+SITUATIONAL_THRESHOLDS = np.array([0.05, 0.10])
+SITUATIONAL_MULTS = np.array([1.0, 1.3, 1.6])
+
+# Weather multiplier indexed by WEATHER_CODES value
+WEATHER_MULTS = np.array([0.8, 1.0, 1.2, 1.4])
+
+# Recent win rate: cold streak buckets are inclusive at the top (<= 50%,
+# <= 52%), so those bounds are nudged up one ulp to fit side='right'
+WIN_RATE_THRESHOLDS = np.array([np.nextafter(0.50, 1.0), np.nextafter(0.52, 1.0), 0.58, 0.60])
+WIN_RATE_MULTS = np.array([0.3, 0.6, 1.0, 1.3, 1.5])
+
+# Absolute drawdown: 20%+ brake, 25%+ emergency stop
+DRAWDOWN_THRESHOLDS = np.array([0.20, 0.25])
+DRAWDOWN_MULTS = np.array([1.0, 0.3, 0.0])
+
+# Final bet-pct tier table (lower bounds, ascending)
+TIER_BOUNDS = np.array([0.005, 0.015, 0.04, 0.08])
+TIER_NAMES = np.array(['D - SKIP', 'C - EXPLORATORY', 'B - STANDARD',
+                       'A - HIGH CONFIDENCE', 'S - SLAM DUNK'])
+TIER_EMOJIS = np.array(['🛑', '🐌', '⚙️', '🔥', '🚀'])
+
+# Number of most recent bets the performance governor looks at
+PERFORMANCE_WINDOW = 20
+
+# Ring-buffer record layout for settled bets
+BET_RECORD_DTYPE = [('tier', 'U24'), ('bet_size', 'f8'), ('profit', 'f8'), ('won', '?')]
+
+# NOAA confidence label -> integer code understood by the compiled core
+WEATHER_CODES = {'LOW': 0, 'MEDIUM': 1, 'HIGH': 2, 'VERY HIGH': 3}
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("numba not installed - Kelly core runs as plain Python")
+
+
+def _bucket(thresholds, x):
+    """Bucket index of x in a sorted threshold table (# thresholds <= x)."""
+    return np.searchsorted(thresholds, x, side='right')
+
+
+def _base_multiplier(edge, confidence, situational_edge, weather_code):
+    """Confidence x edge x situational x weather multiplier."""
+    return (CONF_MULTS[_bucket(CONF_THRESHOLDS, confidence)]
+            * EDGE_MULTS[_bucket(EDGE_THRESHOLDS, edge)]
+            * SITUATIONAL_MULTS[_bucket(SITUATIONAL_THRESHOLDS, situational_edge)]
+            * WEATHER_MULTS[weather_code])
+
+
+def _size_bet(edge, multiplier, bankroll, max_bet_pct):
+    """
+    Turn a final multiplier into a capped bet.
+    
+    Returns:
+        (bet_size, bet_pct, final_kelly_fraction, multiplier, tier_code)
+    """
+    optimal_kelly = edge / 0.25
+    
+    # Never more than 3/4 Kelly
+    final_kelly_fraction = min(max(0.25 * multiplier, 0.0), 0.75)
+    
+    bet_pct = optimal_kelly * final_kelly_fraction
+    if bet_pct > max_bet_pct:
+        bet_pct = max_bet_pct
+    bet_size = bankroll * bet_pct
+    
+    tier_code = _bucket(TIER_BOUNDS, bet_pct)
+    
+    return bet_size, bet_pct, final_kelly_fraction, multiplier, tier_code
+
+
+def _kelly_core_no_perf(edge, confidence, situational_edge, weather_code,
+                        bankroll, max_bet_pct):
+    """Kelly core for the common case with no recent performance data."""
+    multiplier = _base_multiplier(edge, confidence, situational_edge, weather_code)
+    return _size_bet(edge, multiplier, bankroll, max_bet_pct)
+
+
+def _kelly_core(edge, confidence, situational_edge, weather_code,
+                recent_wr, max_dd, bankroll, max_bet_pct):
+    """
+    Kelly core with the recent-performance governor applied.
+    
+    Pure float/int arithmetic and table lookups so numba can compile it in
+    nopython mode.
+    
+    Returns:
+        (bet_size, bet_pct, final_kelly_fraction, multiplier, tier_code)
+    """
+    multiplier = (_base_multiplier(edge, confidence, situational_edge, weather_code)
+                  * WIN_RATE_MULTS[_bucket(WIN_RATE_THRESHOLDS, recent_wr)]
+                  * DRAWDOWN_MULTS[_bucket(DRAWDOWN_THRESHOLDS, abs(max_dd))])
+    return _size_bet(edge, multiplier, bankroll, max_bet_pct)
+
+
+def _kelly_loop(edges, confidences, situational_edges, weather_codes,
+                recent_wrs, max_dds, has_perf, bankroll, max_bet_pct,
+                bet_sizes, bet_pcts, multipliers, tier_codes):
+    """Run the scalar Kelly core over arrays, writing into the out arrays."""
+    for i in range(edges.shape[0]):
+        if has_perf[i]:
+            sized = _kelly_core(edges[i], confidences[i], situational_edges[i],
+                                weather_codes[i], recent_wrs[i], max_dds[i],
+                                bankroll, max_bet_pct)
+        else:
+            sized = _kelly_core_no_perf(edges[i], confidences[i], situational_edges[i],
+                                        weather_codes[i], bankroll, max_bet_pct)
+        bet_sizes[i] = sized[0]
+        bet_pcts[i] = sized[1]
+        multipliers[i] = sized[3]
+        tier_codes[i] = sized[4]
+
+
+if NUMBA_AVAILABLE:
+    # The on-disk cache re-imports agents.aggressive_kelly by name to rebuild
+    # the kernels that call each other, so it is only safe under that name
+    # (not as a script, nor with agents/ itself on sys.path)
+    _NUMBA_CACHE = __name__ == "agents.aggressive_kelly"
+    
+    _bucket = njit(cache=_NUMBA_CACHE)(_bucket)
+    _base_multiplier = njit(cache=_NUMBA_CACHE, fastmath=True)(_base_multiplier)
+    _size_bet = njit(cache=_NUMBA_CACHE, fastmath=True)(_size_bet)
+    
+    # Eager signatures compile at import so the first bet pays no JIT lag
+    _kelly_core_no_perf = njit(
+        'Tuple((float64, float64, float64, float64, int64))'
+        '(float64, float64, float64, int64, float64, float64)',
+        cache=_NUMBA_CACHE,
+        fastmath=True
+    )(_kelly_core_no_perf)
+    _kelly_core = njit(
+        'Tuple((float64, float64, float64, float64, int64))'
+        '(float64, float64, float64, int64, float64, float64, float64, float64)',
+        cache=_NUMBA_CACHE,
+        fastmath=True
+    )(_kelly_core)
+    # nogil so backtests can split a sweep across threads
+    _kelly_loop = njit(cache=_NUMBA_CACHE, nogil=True)(_kelly_loop)
+else:
+    # Interpreted scalar lookups: bisect beats np.searchsorted call overhead
+    _bucket = bisect.bisect_right
+
+
+def kelly_batch(edges, confidences, situational_edges, weather_codes,
+                recent_wrs, max_dds, has_perf, bankroll: float,
+                max_bet_pct: float = 0.10) -> Dict[str, np.ndarray]:
+    """
+    Size many bets in one compiled loop, for backtest inner loops.
+    
+    Unlike calculate_bet_sizes_batch this takes integer weather codes and
+    skips all logging and tier-name lookups. With numba the loop releases
+    the GIL, so a sweep can be chunked across a ThreadPoolExecutor; without
+    it this is a plain Python loop over the same core.
+    
+    Args:
+        edges, confidences, situational_edges: float arrays
+        weather_codes: int array of WEATHER_CODES values
+        recent_wrs, max_dds: float arrays (ignored where has_perf is False)
+        has_perf: bool array, apply the recent-performance governor
+        bankroll: Current bankroll
+        max_bet_pct: Max bet as fraction of bankroll
+        
+    Returns:
+        Dict of arrays: bet_size, bet_pct, multiplier, tier_code
+    """
+    edges = np.ascontiguousarray(edges, dtype=np.float64)
+    n = edges.shape[0]
+    
+    bet_sizes = np.empty(n)
+    bet_pcts = np.empty(n)
+    multipliers = np.empty(n)
+    tier_codes = np.empty(n, dtype=np.int64)
+    
+    _kelly_loop(
+        edges,
+        np.ascontiguousarray(confidences, dtype=np.float64),
+        np.ascontiguousarray(situational_edges, dtype=np.float64),
+        np.ascontiguousarray(weather_codes, dtype=np.int64),
+        np.ascontiguousarray(recent_wrs, dtype=np.float64),
+        np.ascontiguousarray(max_dds, dtype=np.float64),
+        np.ascontiguousarray(has_perf, dtype=np.bool_),
+        float(bankroll), float(max_bet_pct),
+        bet_sizes, bet_pcts, multipliers, tier_codes
+    )
+    
+    return {
+        'bet_size': bet_sizes,
+        'bet_pct': bet_pcts,
+        'multiplier': multipliers,
+        'tier_code': tier_codes
+    }
+
+
+@dataclass(slots=True)
+class KellyResult:
+    """Sizing for a single bet."""
+    
+    bet_size: float
+    bet_pct: float
+    kelly_fraction: float
+    multiplier: float
+    tier: str
+    emoji: str
+    optimal_kelly: float
+    reasoning: Optional[str]
+    
+    def __getitem__(self, key: str):
+        """Dict-style access, for callers written against the old dict result."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
 
 class AggressiveKellyCalculator:
     """
@@ -28,17 +260,139 @@ class AggressiveKellyCalculator:
     - High drawdown (>20%)
     """
     
-    def __init__(self, bankroll: float, max_bet_pct: float = 0.10):
+    def __init__(self, bankroll: float, max_bet_pct: float = 0.10,
+                 history_size: int = 10_000):
         self.bankroll = bankroll
         self.max_bet_pct = max_bet_pct  # Never bet more than 10% on single game
-        self.recent_bets = []
+        
+        # Fixed-size ring buffer of settled bets (oldest overwritten first)
+        self._buf = np.zeros(history_size, dtype=BET_RECORD_DTYPE)
+        self._head = 0
+        self._size = 0
+        
+        # Running per-tier [count, bet_sum, profit_sum, wins] over the buffer
+        self._tier_aggs: Dict[str, List] = defaultdict(lambda: [0, 0.0, 0.0, 0])
+        
+        # Rolling performance window feeding the governor (see update_performance)
+        self._recent_results: deque = deque(maxlen=PERFORMANCE_WINDOW)
+        self._wins = 0
+        self._running_sum = 0.0
+        self._running_sq_sum = 0.0
+        self._equity = float(bankroll)
+        self._peak_equity = float(bankroll)
+        self._trough_equity = float(bankroll)
+        self._performance: Optional[Dict] = None
+    
+    def update_performance(self, won: bool, profit: float):
+        """
+        Add a settled bet to the rolling performance window.
+        
+        O(1): adjusts running win/profit sums for the last
+        PERFORMANCE_WINDOW bets and tracks equity against its running peak,
+        instead of recomputing stats from the full history per bet.
+        """
+        if len(self._recent_results) == self._recent_results.maxlen:
+            old_won, old_profit = self._recent_results[0]
+            self._wins -= old_won
+            self._running_sum -= old_profit
+            self._running_sq_sum -= old_profit * old_profit
+        
+        self._recent_results.append((int(won), profit))
+        self._wins += int(won)
+        self._running_sum += profit
+        self._running_sq_sum += profit * profit
+        
+        # Drawdown of the current episode: deepest equity since the last peak
+        self._equity += profit
+        if self._equity > self._peak_equity:
+            self._peak_equity = self._equity
+            self._trough_equity = self._equity
+        elif self._equity < self._trough_equity:
+            self._trough_equity = self._equity
+        
+        self._performance = None
+    
+    @property
+    def current_performance(self) -> Optional[Dict]:
+        """
+        Rolling win_rate/sharpe/max_drawdown from update_performance.
+        
+        None until at least one result has been recorded. Cached until the
+        next update.
+        """
+        n = len(self._recent_results)
+        if not n:
+            return None
+        
+        if self._performance is None:
+            mean = self._running_sum / n
+            variance = max(self._running_sq_sum / n - mean * mean, 0.0)
+            std = variance ** 0.5
+            
+            self._performance = {
+                'win_rate': self._wins / n,
+                'sharpe': mean / std if std > 0 else 0.0,
+                'max_drawdown': (self._trough_equity - self._peak_equity) / self._peak_equity
+            }
+        
+        return self._performance
+    
+    def record_bet(self, tier: str, bet_size: float, profit: float, won: bool):
+        """
+        Record a settled bet for tier stats.
+        
+        O(1): writes one ring-buffer slot and adjusts the running tier
+        aggregates, evicting the oldest bet once the buffer is full.
+        """
+        capacity = len(self._buf)
+        slot = self._head % capacity
+        
+        if self._size == capacity:
+            old = self._buf[slot]
+            self._update_tier(str(old['tier']), -float(old['bet_size']),
+                              -float(old['profit']), -int(old['won']), -1)
+        else:
+            self._size += 1
+        
+        self._buf[slot] = (tier, bet_size, profit, won)
+        self._head += 1
+        self._update_tier(tier, bet_size, profit, int(won), 1)
+    
+    def _update_tier(self, tier: str, bet_size: float, profit: float,
+                     wins: int, count: int):
+        """Apply a delta to one tier's running aggregates."""
+        agg = self._tier_aggs[tier]
+        agg[0] += count
+        if agg[0] == 0:
+            del self._tier_aggs[tier]
+            return
+        
+        agg[1] += bet_size
+        agg[2] += profit
+        agg[3] += wins
+    
+    @property
+    def recent_bets(self) -> List[Dict]:
+        """Bets currently in the ring buffer, oldest first."""
+        capacity = len(self._buf)
+        start = self._head - self._size
+        return [
+            {
+                'tier': str(rec['tier']),
+                'bet_size': float(rec['bet_size']),
+                'profit': float(rec['profit']),
+                'won': bool(rec['won'])
+            }
+            for rec in (self._buf[i % capacity] for i in range(start, self._head))
+        ]
     
     def calculate_bet_size(self,
                           edge: float,
                           confidence: float,
                           situational_edge: float = 0.0,
                           weather_confidence: str = 'MEDIUM',
-                          recent_performance: Dict = None) -> Dict:
+                          recent_performance: Dict = None,
+                          return_reasoning: bool = True) -> KellyResult:
         """
         Calculate aggressive bet size.
         
@@ -48,136 +402,171 @@ class AggressiveKellyCalculator:
             situational_edge: Historical edge for this situation (0-1)
             weather_confidence: NOAA confidence (LOW/MEDIUM/HIGH/VERY HIGH)
             recent_performance: Recent win rate, sharpe, drawdown
+                (default: current_performance, if results were recorded)
+            return_reasoning: Build the reasoning string (False skips the
+                formatting, e.g. for backtest sweeps; reasoning is None)
             
         Returns:
-            Dict with bet_size, tier, reasoning
+            KellyResult with bet_size, tier, reasoning
         """
         
-        # Default Kelly (edge / variance)
-        # Assume variance ~0.25 for NFL betting
-        optimal_kelly = edge / 0.25
-        
-        # Start with base (1/4 Kelly)
-        kelly_fraction = 0.25
-        multiplier = 1.0
-        
-        # ===== CONFIDENCE MULTIPLIER =====
-        if confidence >= 0.80:
-            multiplier *= 3.0  # SUPER CONFIDENT!
-            tier = 'S'
-        elif confidence >= 0.75:
-            multiplier *= 2.5
-            tier = 'S'
-        elif confidence >= 0.70:
-            multiplier *= 2.0  # Very confident
-            tier = 'A'
-        elif confidence >= 0.65:
-            multiplier *= 1.0  # Standard
-            tier = 'B'
-        elif confidence >= 0.60:
-            multiplier *= 0.5  # Uncertain
-            tier = 'C'
-        else:
-            multiplier *= 0.0  # SKIP
-            tier = 'D'
-        
-        # ===== EDGE MULTIPLIER =====
-        if edge >= 0.15:
-            multiplier *= 1.8  # HUGE edge!
-        elif edge >= 0.10:
-            multiplier *= 1.5
-        elif edge >= 0.05:
-            multiplier *= 1.2
-        elif edge < 0.02:
-            multiplier *= 0.3  # Too small
-        
-        # ===== SITUATIONAL MULTIPLIER =====
+        # Only dispatch, logging and dict assembly live here; the math is in
+        # the _kelly_core kernels
         if situational_edge >= 0.10:
-            multiplier *= 1.6  # Proven 10%+ edge!
             logger.info(f"🎯 SITUATIONAL EDGE: {situational_edge:.1%}")
-        elif situational_edge >= 0.05:
-            multiplier *= 1.3
         
-        # ===== WEATHER CONFIDENCE =====
-        if weather_confidence == 'VERY HIGH':
-            multiplier *= 1.4  # Satellite confirms forecast!
-        elif weather_confidence == 'HIGH':
-            multiplier *= 1.2
-        elif weather_confidence == 'LOW':
-            multiplier *= 0.8  # Uncertain weather
+        weather_code = WEATHER_CODES.get(weather_confidence, 1)
         
-        # ===== PERFORMANCE GOVERNOR =====
-        if recent_performance:
-            recent_wr = recent_performance.get('win_rate', 0.54)
-            recent_sharpe = recent_performance.get('sharpe', 1.0)
-            max_dd = recent_performance.get('max_drawdown', 0.0)
-            
-            # HOT STREAK = ACCELERATE! 🔥
-            if recent_wr >= 0.60:
-                multiplier *= 1.5
-                logger.info("🔥 HOT STREAK - ACCELERATING!")
-            elif recent_wr >= 0.58:
-                multiplier *= 1.3
-            
-            # COLD STREAK = BRAKE! 🛑
-            elif recent_wr <= 0.50:
-                multiplier *= 0.3
-                logger.warning("🐌 COLD STREAK - PULLING BACK")
-            elif recent_wr <= 0.52:
-                multiplier *= 0.6
+        if recent_performance is None:
+            recent_performance = self.current_performance
+        
+        if not recent_performance:
+            return self._fast_no_perf(edge, confidence, situational_edge, weather_code,
+                                      return_reasoning)
+        return self._full_with_perf(edge, confidence, situational_edge, weather_code,
+                                    recent_performance, return_reasoning)
+    
+    def _fast_no_perf(self, edge: float, confidence: float,
+                      situational_edge: float, weather_code: int,
+                      return_reasoning: bool = True) -> KellyResult:
+        """Size a bet without the performance governor."""
+        sized = _kelly_core_no_perf(
+            float(edge), float(confidence), float(situational_edge), weather_code,
+            float(self.bankroll), float(self.max_bet_pct)
+        )
+        return self._build_result(edge, confidence, situational_edge, None,
+                                  return_reasoning, *sized)
+    
+    def _full_with_perf(self, edge: float, confidence: float,
+                        situational_edge: float, weather_code: int,
+                        recent_performance: Dict,
+                        return_reasoning: bool = True) -> KellyResult:
+        """Size a bet with hot/cold streak and drawdown adjustments."""
+        recent_wr = recent_performance.get('win_rate', 0.54)
+        max_dd = recent_performance.get('max_drawdown', 0.0)
+        
+        if recent_wr >= 0.60:
+            logger.info("🔥 HOT STREAK - ACCELERATING!")
+        elif recent_wr <= 0.50:
+            logger.warning("🐌 COLD STREAK - PULLING BACK")
+        if abs(max_dd) >= 0.25:
+            logger.error("🚨 EMERGENCY STOP - Max drawdown exceeded!")
+        elif abs(max_dd) >= 0.20:
+            logger.warning("⚠️ High drawdown - reducing aggression")
+        
+        sized = _kelly_core(
+            float(edge), float(confidence), float(situational_edge), weather_code,
+            float(recent_wr), float(max_dd),
+            float(self.bankroll), float(self.max_bet_pct)
+        )
+        return self._build_result(edge, confidence, situational_edge,
+                                  recent_performance, return_reasoning, *sized)
+    
+    def _build_result(self, edge, confidence, situational_edge, recent_performance,
+                      return_reasoning, bet_size, bet_pct, final_kelly_fraction,
+                      multiplier, tier_code) -> KellyResult:
+        """Assemble the result from a kernel's output."""
+        if bet_pct == self.max_bet_pct:
+            logger.info(f"⚠️ Capping bet at {self.max_bet_pct:.1%} of bankroll")
+        
+        reasoning = None
+        if return_reasoning:
+            reasoning = self._explain_sizing(
+                confidence, edge, situational_edge, multiplier, recent_performance
+            )
+        
+        return KellyResult(
+            bet_size=round(bet_size, 2),
+            bet_pct=bet_pct,
+            kelly_fraction=final_kelly_fraction,
+            multiplier=multiplier,
+            tier=str(TIER_NAMES[tier_code]),
+            emoji=str(TIER_EMOJIS[tier_code]),
+            optimal_kelly=edge / 0.25,
+            reasoning=reasoning
+        )
+    
+    def calculate_bet_sizes_batch(self,
+                                  edges: Sequence[float],
+                                  confidences: Sequence[float],
+                                  situational_edges: Optional[Sequence[float]] = None,
+                                  weather_confidences: Optional[Sequence[str]] = None,
+                                  recent_perfs: Optional[Sequence[Optional[Dict]]] = None
+                                  ) -> Dict[str, np.ndarray]:
+        """
+        Size a whole slate of candidate bets in one vectorized pass.
+        
+        Applies the same threshold tables as ``calculate_bet_size`` with one
+        np.searchsorted per factor instead of per-bet Python branches.
+        
+        Args:
+            edges: Model edges (prob - implied_prob)
+            confidences: Model confidences (0-1)
+            situational_edges: Historical situational edges (default 0.0)
+            weather_confidences: NOAA confidence labels (default 'MEDIUM')
+            recent_perfs: Per-bet recent performance dicts (or None)
             
-            # SEVERE DRAWDOWN = EMERGENCY STOP! 🚨
-            if abs(max_dd) >= 0.25:
-                multiplier = 0.0
-                tier = 'X'
-                logger.error("🚨 EMERGENCY STOP - Max drawdown exceeded!")
-            elif abs(max_dd) >= 0.20:
-                multiplier *= 0.3
-                logger.warning("⚠️ High drawdown - reducing aggression")
+        Returns:
+            Dict of arrays: bet_size, bet_pct, kelly_fraction, multiplier,
+            tier, emoji, optimal_kelly, capped
+        """
+        edge = np.asarray(edges, dtype=float)
+        conf = np.asarray(confidences, dtype=float)
+        n = edge.shape[0]
         
-        # ===== CALCULATE FINAL BET SIZE =====
-        final_kelly_fraction = kelly_fraction * multiplier
+        sit = (np.zeros(n) if situational_edges is None
+               else np.asarray(situational_edges, dtype=float))
+        weather_code = (np.ones(n, dtype=np.int64) if weather_confidences is None
+                        else np.array([WEATHER_CODES.get(w, 1) for w in weather_confidences],
+                                 dtype=np.int64))
         
-        # Safety caps
-        final_kelly_fraction = np.clip(final_kelly_fraction, 0, 0.75)  # Never more than 3/4 Kelly
+        # Unpack performance dicts; bets without one skip the governor
+        has_perf = np.zeros(n, dtype=bool)
+        recent_wr = np.full(n, 0.54)
+        max_dd = np.zeros(n)
+        if recent_perfs is not None:
+            for i, perf in enumerate(recent_perfs):
+                if perf:
+                    has_perf[i] = True
+                    recent_wr[i] = perf.get('win_rate', 0.54)
+                    max_dd[i] = perf.get('max_drawdown', 0.0)
         
-        bet_size_kelly = self.bankroll * optimal_kelly * final_kelly_fraction
-        bet_size_pct = bet_size_kelly / self.bankroll
+        # Default Kelly (edge / variance), variance ~0.25 for NFL betting
+        optimal_kelly = edge / 0.25
+        kelly_fraction = 0.25
         
-        # Absolute safety: Never more than 10% of bankroll
-        if bet_size_pct > self.max_bet_pct:
-            bet_size_pct = self.max_bet_pct
-            bet_size_kelly = self.bankroll * self.max_bet_pct
-            logger.info(f"⚠️ Capping bet at {self.max_bet_pct:.1%} of bankroll")
+        multiplier = (CONF_MULTS[np.searchsorted(CONF_THRESHOLDS, conf, side='right')]
+                      * EDGE_MULTS[np.searchsorted(EDGE_THRESHOLDS, edge, side='right')]
+                      * SITUATIONAL_MULTS[np.searchsorted(SITUATIONAL_THRESHOLDS, sit, side='right')]
+                      * WEATHER_MULTS[weather_code])
         
-        # Classify tier
-        if bet_size_pct >= 0.08:
-            tier = 'S - SLAM DUNK'
-            emoji = '🚀'
-        elif bet_size_pct >= 0.04:
-            tier = 'A - HIGH CONFIDENCE'
-            emoji = '🔥'
-        elif bet_size_pct >= 0.015:
-            tier = 'B - STANDARD'
-            emoji = '⚙️'
-        elif bet_size_pct >= 0.005:
-            tier = 'C - EXPLORATORY'
-            emoji = '🐌'
-        else:
-            tier = 'D - SKIP'
-            emoji = '🛑'
+        # ===== PERFORMANCE GOVERNOR =====
+        governor = (WIN_RATE_MULTS[np.searchsorted(WIN_RATE_THRESHOLDS, recent_wr, side='right')]
+                    * DRAWDOWN_MULTS[np.searchsorted(DRAWDOWN_THRESHOLDS, np.abs(max_dd), side='right')])
+        multiplier = np.where(has_perf, multiplier * governor, multiplier)
+        
+        # ===== CALCULATE FINAL BET SIZE =====
+        # Never more than 3/4 Kelly
+        final_kelly_fraction = np.clip(kelly_fraction * multiplier, 0, 0.75)
+        
+        bet_size_pct = optimal_kelly * final_kelly_fraction
+        
+        # Absolute safety: Never more than max_bet_pct of bankroll
+        capped = bet_size_pct > self.max_bet_pct
+        bet_size_pct = np.minimum(bet_size_pct, self.max_bet_pct)
+        bet_size = np.round(self.bankroll * bet_size_pct, 2)
+        
+        tier_idx = np.searchsorted(TIER_BOUNDS, bet_size_pct, side='right')
         
         return {
-            'bet_size': round(bet_size_kelly, 2),
+            'bet_size': bet_size,
             'bet_pct': bet_size_pct,
             'kelly_fraction': final_kelly_fraction,
             'multiplier': multiplier,
-            'tier': tier,
-            'emoji': emoji,
+            'tier': TIER_NAMES[tier_idx],
+            'emoji': TIER_EMOJIS[tier_idx],
             'optimal_kelly': optimal_kelly,
-            'reasoning': self._explain_sizing(
-                confidence, edge, situational_edge, multiplier, recent_performance
-            )
+            'capped': capped
         }
     
     def _explain_sizing(self, confidence, edge, situational_edge, multiplier, recent_perf):
@@ -205,21 +594,20 @@ class AggressiveKellyCalculator:
     
     def get_tier_stats(self) -> pd.DataFrame:
         """Get performance by tier."""
-        if not self.recent_bets:
+        if not self._size:
             return pd.DataFrame()
         
-        df = pd.DataFrame(self.recent_bets)
-        
-        tier_stats = df.groupby('tier').agg({
-            'bet_size': ['count', 'mean', 'sum'],
-            'profit': 'sum',
-            'won': lambda x: (x == True).sum()
-        })
+        tier_stats = pd.DataFrame.from_dict(
+            self._tier_aggs, orient='index',
+            columns=['count', 'bet_size_sum', 'profit_sum', 'won']
+        )
+        tier_stats.index.name = 'tier'
         
+        tier_stats['bet_size_mean'] = tier_stats['bet_size_sum'] / tier_stats['count']
         tier_stats['win_rate'] = tier_stats['won'] / tier_stats['count']
         tier_stats['roi'] = tier_stats['profit_sum'] / tier_stats['bet_size_sum']
         
-        return tier_stats
+        return tier_stats.sort_index()
 
 
 if __name__ == '__main__':
@@ -239,10 +627,10 @@ if __name__ == '__main__':
         weather_confidence='VERY HIGH',
         recent_performance={'win_rate': 0.60, 'sharpe': 2.5, 'max_drawdown': -0.10}
     )
-    print(f"  Bet size: ${result['bet_size']} ({result['bet_pct']:.1%} of bankroll)")
-    print(f"  Tier: {result['tier']} {result['emoji']}")
-    print(f"  Kelly multiplier: {result['multiplier']:.2f}×")
-    print(f"  Reasoning: {result['reasoning']}")
+    print(f"  Bet size: ${result.bet_size} ({result.bet_pct:.1%} of bankroll)")
+    print(f"  Tier: {result.tier} {result.emoji}")
+    print(f"  Kelly multiplier: {result.multiplier:.2f}×")
+    print(f"  Reasoning: {result.reasoning}")
     
     # Example 2: Standard
     print("\n2. STANDARD BET")
@@ -253,9 +641,9 @@ if __name__ == '__main__':
         weather_confidence='MEDIUM',
         recent_performance={'win_rate': 0.54, 'sharpe': 1.2, 'max_drawdown': -0.15}
     )
-    print(f"  Bet size: ${result['bet_size']} ({result['bet_pct']:.1%} of bankroll)")
-    print(f"  Tier: {result['tier']} {result['emoji']}")
-    print(f"  Reasoning: {result['reasoning']}")
+    print(f"  Bet size: ${result.bet_size} ({result.bet_pct:.1%} of bankroll)")
+    print(f"  Tier: {result.tier} {result.emoji}")
+    print(f"  Reasoning: {result.reasoning}")
     
     # Example 3: SKIP
     print("\n3. LOW CONFIDENCE (SKIP)")
@@ -266,9 +654,9 @@ if __name__ == '__main__':
         weather_confidence='LOW',
         recent_performance={'win_rate': 0.51, 'sharpe': 0.5, 'max_drawdown': -0.22}
     )
-    print(f"  Bet size: ${result['bet_size']} ({result['bet_pct']:.1%} of bankroll)")
-    print(f"  Tier: {result['tier']} {result['emoji']}")
-    print(f"  Reasoning: {result['reasoning']}")
+    print(f"  Bet size: ${result.bet_size} ({result.bet_pct:.1%} of bankroll)")
+    print(f"  Tier: {result.tier} {result.emoji}")
+    print(f"  Reasoning: {result.reasoning}")
     
     print("\n" + "="*70)
 
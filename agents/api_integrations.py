@@ -4,17 +4,134 @@ COMPLETE API INTEGRATIONS - VERIFIED WORKING ENDPOINTS
 All endpoints tested and verified as of 2025-11-24.
 """
 
+import asyncio
 import logging
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# SQLite HTTP caches live alongside the other on-disk caches
+HTTP_CACHE_DIR = Path("data/http_cache")
+
+# requests_cache sentinel for "cache forever"
+NEVER_EXPIRE = -1
+
+
+def _build_session(cache_name: str,
+                   expire_after: int,
+                   urls_expire_after: Optional[Dict[str, int]] = None,
+                   ignored_parameters: Optional[List[str]] = None) -> requests.Session:
+    """
+    Build a pooled, retrying and (when available) response-caching session.
+    
+    Args:
+        cache_name: SQLite cache file name under HTTP_CACHE_DIR
+        expire_after: Default TTL in seconds for cached responses
+        urls_expire_after: Per-URL-pattern TTL overrides
+        ignored_parameters: Query params left out of cache keys (e.g. API keys)
+    
+    Returns:
+        requests_cache.CachedSession, or a plain requests.Session if
+        requests-cache is not installed
+    """
+    try:
+        import requests_cache
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        session = requests_cache.CachedSession(
+            str(HTTP_CACHE_DIR / cache_name),
+            backend='sqlite',
+            expire_after=expire_after,
+            urls_expire_after=urls_expire_after or {},
+            ignored_parameters=ignored_parameters,
+            allowable_codes=(200,),
+        )
+    except ImportError:
+        logger.debug("requests-cache not installed - HTTP responses not cached")
+        session = requests.Session()
+    
+    # Keep-alive pool + retry/backoff on throttling and transient 5xx
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Failures every client handles the same way: transport errors (after the
+# adapter's retries), undecodable bodies and unexpected payload shapes
+API_ERRORS = (requests.RequestException, ValueError, KeyError)
+
+
+def _json(response):
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _ttl_cache(seconds):
+    """
+    Cache a method's non-empty results per instance for `seconds`.
+    
+    Keyed on the call arguments, so e.g. get_scoreboard(2024, 12) and
+    get_scoreboard(2024, 13) are cached separately. Empty results
+    (failed requests) are never cached. `seconds` may also be a function
+    of the result, for payloads whose freshness depends on their content.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = self.__dict__.setdefault('_ttl_cache', {})
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            
+            hit = cache.get(key)
+            if hit is not None and now - hit[0] < hit[2]:
+                return hit[1]
+            
+            result = func(self, *args, **kwargs)
+            if result:
+                ttl = seconds(result) if callable(seconds) else seconds
+                cache[key] = (now, result, ttl)
+            return result
+        return wrapper
+    return decorator
+
+
+def _game_summary_ttl(summary: Dict) -> int:
+    """Cache finished games for a day; live or upcoming ones like the scoreboard."""
+    try:
+        completed = summary['header']['competitions'][0]['status']['type']['completed']
+    except (KeyError, IndexError, TypeError):
+        completed = False
+    return 24 * 3600 if completed else 60
+
 
 # ============================================================================
 # 1. NOAA WEATHER API (✅ VERIFIED WORKING)
@@ -31,8 +148,20 @@ class NOAAWeatherAPI:
     
     BASE_URL = "https://api.weather.gov"
     
+    # Forecasts refresh ~hourly; the /points grid mapping never changes
+    CACHE_TTL = 600
+    CACHE_URL_TTLS = {
+        'api.weather.gov/points': NEVER_EXPIRE,
+        'api.weather.gov/alerts': 60,
+    }
+    
+    # (lat, lon) -> gridpoint forecast URL, shared by all instances.
+    # NOAA's 2.5 km grid is static, so once resolved a stadium never needs
+    # the /points hop again. Pre-seed entries here to skip it entirely.
+    STADIUM_FORECAST_URLS: Dict[Tuple[float, float], str] = {}
+    
     def __init__(self):
-        self.session = requests.Session()
+        self.session = _build_session('noaa', self.CACHE_TTL, self.CACHE_URL_TTLS)
         self.session.headers.update({
             'User-Agent': '(NFL-Betting-System, contact@example.com)',  # Required!
             'Accept': 'application/geo+json'
@@ -55,42 +184,118 @@ class NOAAWeatherAPI:
             >>> print(forecast['temperature'], forecast['wind_speed'])
         """
         try:
-            # Step 1: Get forecast URL for location
-            points_url = f"{self.BASE_URL}/points/{lat},{lon}"
+            # Step 1: Get forecast URL for location (memoized per stadium)
             logger.info(f"Fetching forecast for {lat},{lon}...")
-            
-            response = self.session.get(points_url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            forecast_url = data['properties']['forecast']
+            forecast_url = self._resolve_forecast_url(lat, lon)
+            if forecast_url is None:
+                return {}
             
             # Step 2: Get detailed forecast
             forecast_response = self.session.get(forecast_url, timeout=10)
-            forecast_response.raise_for_status()
+            if not forecast_response.ok:
+                logger.warning(f"NOAA forecast failed: {forecast_response.status_code}")
+                return {}
             
-            forecast_data = forecast_response.json()
-            periods = forecast_data['properties']['periods']
+            return self._current_period(_json(forecast_response))
+        
+        except API_ERRORS as e:
+            logger.error(f"NOAA API error: {e}")
+            return {}
+    
+    async def get_forecasts_for_stadiums(self, coords: List[Tuple[float, float]]) -> List[Dict]:
+        """
+        Get forecasts for many stadiums concurrently.
+        
+        Every stadium's points -> forecast chain runs at the same time, so a
+        full slate costs roughly two round-trips instead of two per stadium.
+        
+        Args:
+            coords: List of (lat, lon) tuples
+        
+        Returns:
+            List of forecast dicts in the same order as coords
+            (empty dict for any stadium that failed)
+        
+        Example:
+            >>> api = NOAAWeatherAPI()
+            >>> forecasts = await api.get_forecasts_for_stadiums(
+            ...     [(39.0489, -94.4839), (44.5013, -88.0622)])
+        """
+        import httpx
+        
+        async with httpx.AsyncClient(
+            headers=dict(self.session.headers),
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=20),
+        ) as client:
+            return await asyncio.gather(
+                *[self._get_forecast_async(client, lat, lon) for lat, lon in coords]
+            )
+    
+    def get_forecasts_for_stadiums_sync(self, coords: List[Tuple[float, float]]) -> List[Dict]:
+        """Blocking wrapper around get_forecasts_for_stadiums for legacy callers."""
+        return asyncio.run(self.get_forecasts_for_stadiums(coords))
+    
+    async def _get_forecast_async(self, client, lat: float, lon: float) -> Dict:
+        """Fetch one stadium forecast on a shared httpx.AsyncClient."""
+        import httpx
+        
+        try:
+            forecast_url = self.STADIUM_FORECAST_URLS.get((lat, lon))
+            if forecast_url is None:
+                response = await client.get(self._points_url(lat, lon))
+                if not response.is_success:
+                    logger.warning(f"NOAA points failed for {lat},{lon}: {response.status_code}")
+                    return {}
+                forecast_url = _json(response)['properties']['forecast']
+                self.STADIUM_FORECAST_URLS[(lat, lon)] = forecast_url
             
-            # Return current period
-            current = periods[0]
+            forecast_response = await client.get(forecast_url)
+            if not forecast_response.is_success:
+                logger.warning(f"NOAA forecast failed for {lat},{lon}: {forecast_response.status_code}")
+                return {}
             
-            return {
-                'temperature': current['temperature'],
-                'temperature_unit': current['temperatureUnit'],
-                'wind_speed': current['windSpeed'],
-                'wind_direction': current['windDirection'],
-                'short_forecast': current['shortForecast'],
-                'detailed_forecast': current['detailedForecast'],
-                'icon': current['icon'],
-                'is_daytime': current['isDaytime'],
-                'raw_data': current
-            }
+            return self._current_period(_json(forecast_response))
         
-        except Exception as e:
-            logger.error(f"NOAA API error: {e}")
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            logger.error(f"NOAA API error for {lat},{lon}: {e}")
             return {}
     
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _points_url(cls, lat: float, lon: float) -> str:
+        """NOAA /points URL for a location, formatted once per stadium."""
+        return f"{cls.BASE_URL}/points/{lat},{lon}"
+    
+    def _resolve_forecast_url(self, lat: float, lon: float) -> Optional[str]:
+        """Look up (and remember) the gridpoint forecast URL for a location."""
+        forecast_url = self.STADIUM_FORECAST_URLS.get((lat, lon))
+        if forecast_url is None:
+            response = self.session.get(self._points_url(lat, lon), timeout=10)
+            if not response.ok:
+                logger.warning(f"NOAA points failed for {lat},{lon}: {response.status_code}")
+                return None
+            forecast_url = _json(response)['properties']['forecast']
+            self.STADIUM_FORECAST_URLS[(lat, lon)] = forecast_url
+        return forecast_url
+    
+    @staticmethod
+    def _current_period(forecast_data: Dict) -> Dict:
+        """Flatten the current forecast period into our forecast dict."""
+        current = forecast_data['properties']['periods'][0]
+        
+        return {
+            'temperature': current['temperature'],
+            'temperature_unit': current['temperatureUnit'],
+            'wind_speed': current['windSpeed'],
+            'wind_direction': current['windDirection'],
+            'short_forecast': current['shortForecast'],
+            'detailed_forecast': current['detailedForecast'],
+            'icon': current['icon'],
+            'is_daytime': current['isDaytime'],
+            'raw_data': current
+        }
+    
     def get_alerts(self, state: str) -> List[Dict]:
         """
         Get active weather alerts for a state.
@@ -108,12 +313,14 @@ class NOAAWeatherAPI:
         try:
             alerts_url = f"{self.BASE_URL}/alerts/active?area={state}"
             response = self.session.get(alerts_url, timeout=10)
-            response.raise_for_status()
+            if not response.ok:
+                logger.warning(f"NOAA alerts failed: {response.status_code}")
+                return []
             
-            data = response.json()
+            data = _json(response)
             return data.get('features', [])
         
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"NOAA alerts error: {e}")
             return []
 
@@ -133,6 +340,12 @@ class TheOddsAPI:
     
     BASE_URL = "https://api.the-odds-api.com/v4"
     
+    # Odds move fast - only collapse near-simultaneous duplicate requests
+    CACHE_TTL = 30
+    
+    # Stop multi-request fan-outs before the monthly quota runs dry
+    MIN_REMAINING_REQUESTS = 10
+    
     def __init__(self, api_key: Optional[str] = None, use_cache: bool = True):
         """
         Initialize The Odds API client.
@@ -152,7 +365,8 @@ class TheOddsAPI:
         if not self.api_key:
             logger.warning("No API key provided. Set ODDS_API_KEY environment variable.")
         
-        self.session = requests.Session()
+        self.session = _build_session('odds_api', self.CACHE_TTL,
+                                      ignored_parameters=['apiKey'])
         
         # Initialize cache
         self.use_cache = use_cache
@@ -238,7 +452,6 @@ class TheOddsAPI:
         
         # Fetch fresh data
         try:
-            import time
             start_time = time.time()
             
             url = f"{self.BASE_URL}/sports/americanfootball_nfl/odds/"
@@ -252,7 +465,9 @@ class TheOddsAPI:
             
             logger.info(f"Fetching NFL odds from The Odds API...")
             response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            if not response.ok:
+                logger.warning(f"The Odds API failed: {response.status_code}")
+                return self._stale_cache_games()
             
             response_time_ms = int((time.time() - start_time) * 1000)
             
@@ -261,7 +476,7 @@ class TheOddsAPI:
             used = response.headers.get('x-requests-used')
             logger.info(f"API Requests - Used: {used}, Remaining: {remaining}")
             
-            games = response.json()
+            games = _json(response)
             
             # Update cache
             if self.use_cache and self.cache:
@@ -272,25 +487,130 @@ class TheOddsAPI:
                 }
                 self.cache.set({'data': cache_data}, 'nfl_odds')
                 
-                # Update rate limit tracking
-                if remaining:
+                # Update rate limit tracking (cached replies carry stale headers)
+                if remaining and not getattr(response, 'from_cache', False):
                     self.cache.update_api_usage(int(remaining), response_time_ms)
             
             return games
         
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"The Odds API error: {e}")
+            return self._stale_cache_games()
+    
+    def _stale_cache_games(self) -> List[Dict]:
+        """Fall back to up to 4hr old cached odds after an API failure."""
+        if self.use_cache and self.cache:
+            logger.warning("API error - attempting to use stale cache")
+            cached_data = self.cache.get('nfl_odds', max_age_minutes=240)  # Accept 4hr old
+            if cached_data:
+                games = self._extract_games_from_cache(cached_data)
+                logger.info(f"[CACHE FALLBACK] Loaded {len(games)} games from stale cache")
+                return games
+        
+        return []
+    
+    def get_nfl_odds_multi(self,
+                           markets: List[str],
+                           regions: List[str],
+                           max_workers: int = 8) -> List[Dict]:
+        """
+        Get NFL odds for every (market, region) pair concurrently.
+        
+        Each combination is its own request, issued in parallel over the
+        shared keep-alive session, and the results are merged per game so
+        each game carries all bookmakers and markets. Stops issuing new
+        requests once the quota drops below MIN_REMAINING_REQUESTS; replies
+        to requests already sent are still merged.
+        
+        Args:
+            markets: Markets to fetch (e.g., ['h2h', 'spreads', 'totals'])
+            regions: Regions to fetch (e.g., ['us', 'us2'])
+            max_workers: Maximum concurrent requests
+        
+        Returns:
+            List of games with merged bookmaker odds
+        
+        Example:
+            >>> api = TheOddsAPI()
+            >>> odds = api.get_nfl_odds_multi(['h2h', 'spreads', 'totals'], ['us', 'us2'])
+        """
+        if not self.api_key:
+            logger.error("API key required. Sign up at the-odds-api.com")
+            return []
+        
+        url = f"{self.BASE_URL}/sports/americanfootball_nfl/odds/"
+        param_list = [
+            {
+                'apiKey': self.api_key,
+                'regions': region,
+                'markets': market,
+                'oddsFormat': 'american',
+                'dateFormat': 'iso'
+            }
+            for market in markets
+            for region in regions
+        ]
+        if not param_list:
+            return []
+        
+        games_by_id: Dict[str, Dict] = {}
+        # Set by the worker that sees a low quota, so requests already picked
+        # up by other workers are skipped rather than sent
+        quota_low = threading.Event()
+        
+        logger.info(f"Fetching NFL odds for {len(param_list)} market/region pairs...")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(param_list))) as executor:
+            futures = [executor.submit(self._fetch_odds, url, params, quota_low)
+                       for params in param_list]
             
-            # Try to return stale cache on error
-            if self.use_cache and self.cache:
-                logger.warning("API error - attempting to use stale cache")
-                cached_data = self.cache.get('nfl_odds', max_age_minutes=240)  # Accept 4hr old
-                if cached_data:
-                    games = self._extract_games_from_cache(cached_data)
-                    logger.info(f"[CACHE FALLBACK] Loaded {len(games)} games from stale cache")
-                    return games
+            for future in as_completed(futures):
+                games, _ = future.result()
+                self._merge_games(games_by_id, games)
+        
+        if quota_low.is_set():
+            logger.warning(f"Fewer than {self.MIN_REMAINING_REQUESTS} Odds API requests left - "
+                           f"stopped fan-out")
+        
+        return list(games_by_id.values())
+    
+    def _fetch_odds(self, url: str, params: Dict,
+                    quota_low: threading.Event) -> Tuple[List[Dict], Optional[int]]:
+        """Fetch one odds request unless quota_low is set; returns (games, requests remaining)."""
+        if quota_low.is_set():
+            return [], None
+        try:
+            response = self.session.get(url, params=params, timeout=10)
+            if not response.ok:
+                logger.warning(f"The Odds API failed ({params['markets']}/{params['regions']}): "
+                               f"{response.status_code}")
+                return [], None
             
-            return []
+            remaining = response.headers.get('x-requests-remaining')
+            remaining = int(remaining) if remaining else None
+            if remaining is not None and remaining < self.MIN_REMAINING_REQUESTS:
+                quota_low.set()
+            return _json(response), remaining
+        
+        except API_ERRORS as e:
+            logger.error(f"The Odds API error ({params['markets']}/{params['regions']}): {e}")
+            return [], None
+    
+    @staticmethod
+    def _merge_games(games_by_id: Dict[str, Dict], games: List[Dict]):
+        """Fold one response into games_by_id, merging bookmakers and markets."""
+        for game in games:
+            merged = games_by_id.get(game['id'])
+            if merged is None:
+                games_by_id[game['id']] = game
+                continue
+            
+            books = {book['key']: book for book in merged['bookmakers']}
+            for book in game.get('bookmakers', []):
+                if book['key'] in books:
+                    books[book['key']]['markets'].extend(book['markets'])
+                else:
+                    merged['bookmakers'].append(book)
+                    books[book['key']] = book
     
     def get_available_sports(self) -> List[Dict]:
         """Get list of all available sports."""
@@ -302,11 +622,13 @@ class TheOddsAPI:
             params = {'apiKey': self.api_key}
             
             response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            if not response.ok:
+                logger.warning(f"Sports list failed: {response.status_code}")
+                return []
             
-            return response.json()
+            return _json(response)
         
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"Sports list error: {e}")
             return []
 
@@ -326,9 +648,16 @@ class ESPNAPI:
     
     BASE_URL = "http://site.api.espn.com/apis/site/v2/sports/football/nfl"
     
+    # Scoreboard changes minute to minute; the team list is stable all season
+    CACHE_TTL = 60
+    CACHE_URL_TTLS = {
+        '*/football/nfl/teams': 24 * 3600,
+    }
+    
     def __init__(self):
-        self.session = requests.Session()
+        self.session = _build_session('espn', self.CACHE_TTL, self.CACHE_URL_TTLS)
     
+    @_ttl_cache(seconds=60)
     def get_scoreboard(self, season: int = 2024, week: Optional[int] = None) -> Dict:
         """
         Get current scoreboard or specific week.
@@ -357,27 +686,33 @@ class ESPNAPI:
             
             logger.info(f"Fetching ESPN scoreboard...")
             response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            if not response.ok:
+                logger.warning(f"ESPN scoreboard failed: {response.status_code}")
+                return {}
             
-            return response.json()
+            return _json(response)
         
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"ESPN API error: {e}")
             return {}
     
+    @_ttl_cache(seconds=24 * 3600)
     def get_teams(self) -> Dict:
         """Get all NFL teams data."""
         try:
             url = f"{self.BASE_URL}/teams"
             response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            if not response.ok:
+                logger.warning(f"ESPN teams failed: {response.status_code}")
+                return {}
             
-            return response.json()
+            return _json(response)
         
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"ESPN teams error: {e}")
             return {}
     
+    @_ttl_cache(seconds=_game_summary_ttl)
     def get_game_summary(self, game_id: str) -> Dict:
         """
         Get detailed game summary.
@@ -393,11 +728,13 @@ class ESPNAPI:
             params = {'event': game_id}
             
             response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            if not response.ok:
+                logger.warning(f"ESPN summary failed: {response.status_code}")
+                return {}
             
-            return response.json()
+            return _json(response)
         
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"ESPN summary error: {e}")
             return {}
 
@@ -421,6 +758,12 @@ class NFLVerseAPI:
         https://github.com/nflverse/nflverse-data
     """
     
+    PBP_URL = ("https://github.com/nflverse/nflverse-data/releases/download/"
+               "pbp/play_by_play_{season}.parquet")
+    
+    # Raw season parquet files, shared across runs
+    CACHE_DIR = Path.home() / ".cache" / "nflverse"
+    
     def __init__(self):
         try:
             import nflreadpy as nfl
@@ -430,35 +773,158 @@ class NFLVerseAPI:
             logger.error("[ERROR] nflreadpy not installed. Run: pip install nflreadpy")
             self.nfl = None
     
-    def get_play_by_play(self, seasons: List[int]) -> pd.DataFrame:
+    def get_play_by_play(self, seasons: List[int],
+                         columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Get play-by-play data with EPA metrics.
         
+        Reads the nflverse release parquet files directly with pyarrow, so
+        only the requested columns are decoded (pbp has ~370 columns).
+        
         Args:
             seasons: List of seasons (e.g., [2023, 2024])
+            columns: Columns to load (default: all)
         
         Returns:
             DataFrame with all plays including EPA, win probability, etc.
         
         Example:
             >>> api = NFLVerseAPI()
-            >>> pbp = api.get_play_by_play([2024])
-            >>> print(pbp.columns)
-            >>> print(pbp[['game_id', 'desc', 'epa', 'wp']].head())
+            >>> pbp = api.get_play_by_play([2024], columns=['game_id', 'desc', 'epa', 'wp'])
+            >>> print(pbp.head())
         """
-        if not self.nfl:
-            return pd.DataFrame()
-        
         try:
-            logger.info(f"Downloading play-by-play data for {seasons}...")
-            pbp = self.nfl.import_pbp_data(seasons)
-            logger.info(f"[OK] Downloaded {len(pbp)} plays")
+            logger.info(f"Loading play-by-play data for {seasons}...")
+            table = self._read_pbp_table(seasons, columns)
+            
+            # self_destruct frees Arrow buffers as pandas takes them over
+            pbp = table.to_pandas(split_blocks=True, self_destruct=True)
+            logger.info(f"[OK] Loaded {len(pbp)} plays")
             return pbp
         
-        except Exception as e:
+        except (requests.RequestException, OSError, ValueError) as e:
             logger.error(f"nflverse PBP error: {e}")
             return pd.DataFrame()
     
+    def get_play_by_play_numpy(self, seasons: List[int],
+                               columns: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Get play-by-play columns as NumPy arrays, skipping pandas entirely.
+        
+        For numeric consumers (EPA aggregation, Kelly sweeps) this avoids
+        the Arrow -> pandas BlockManager copy and its peak memory.
+        
+        Args:
+            seasons: List of seasons (e.g., [2023, 2024])
+            columns: Columns to load
+        
+        Returns:
+            Dict of column name -> array (empty dict on failure)
+        
+        Example:
+            >>> api = NFLVerseAPI()
+            >>> pbp = api.get_play_by_play_numpy([2024], ['epa', 'wp'])
+            >>> print(pbp['epa'].mean())
+        """
+        try:
+            table = self._read_pbp_table(seasons, columns)
+            return {c: table.column(c).to_numpy(zero_copy_only=False) for c in columns}
+        
+        except (requests.RequestException, OSError, ValueError) as e:
+            logger.error(f"nflverse PBP error: {e}")
+            return {}
+    
+    def _read_pbp_table(self, seasons: List[int], columns: Optional[List[str]]):
+        """
+        Read the requested pbp seasons/columns into one pyarrow Table.
+        
+        All season files go through a single dataset scan, so pyarrow decodes
+        them concurrently and returns one chunked table (no concat step).
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+        
+        paths = [str(path) for path in self._pbp_paths(seasons)]
+        
+        # Seasons add/retype columns over time, so scan against the merged schema
+        schema = pa.unify_schemas([pq.read_schema(path) for path in paths],
+                                  promote_options='default')
+        dataset = ds.dataset(paths, schema=schema, format='parquet')
+        return dataset.to_table(columns=columns, use_threads=True)
+    
+    def get_play_by_play_lazy(self, seasons: List[int]):
+        """
+        Get play-by-play data as a Polars LazyFrame.
+        
+        Nothing is decoded until collect(), and Polars pushes filters and
+        column selections down into the parquet reader.
+        
+        Args:
+            seasons: List of seasons (e.g., [2023, 2024])
+        
+        Returns:
+            polars.LazyFrame over all requested seasons
+        
+        Example:
+            >>> import polars as pl
+            >>> api = NFLVerseAPI()
+            >>> epa = (api.get_play_by_play_lazy([2023, 2024])
+            ...        .filter(pl.col('season_type') == 'REG')
+            ...        .select(['game_id', 'epa', 'wp'])
+            ...        .collect())
+        """
+        import polars as pl
+        
+        # Seasons add/retype columns over time, so relax schemas on concat
+        return pl.concat(
+            [pl.scan_parquet(path) for path in self._pbp_paths(seasons)],
+            how='diagonal_relaxed'
+        )
+    
+    def _pbp_paths(self, seasons: List[int]) -> List[Path]:
+        """Local pbp paths for several seasons, downloading missing ones in parallel."""
+        if len(seasons) <= 1:
+            return [self._pbp_path(season) for season in seasons]
+        
+        with ThreadPoolExecutor(max_workers=min(len(seasons), 8)) as executor:
+            return list(executor.map(self._pbp_path, seasons))
+    
+    def _pbp_path(self, season: int) -> Path:
+        """
+        Local path of a season's pbp parquet, downloading it if needed.
+        
+        Completed seasons are cached forever; the current season is
+        re-downloaded once a day (nflverse updates nightly).
+        """
+        path = self.CACHE_DIR / f"play_by_play_{season}.parquet"
+        
+        if path.exists():
+            now = datetime.now()
+            # A season runs September to February: the 2024 playoffs are in 2025
+            current_season = now.year if now.month >= 9 else now.year - 1
+            age = now - datetime.fromtimestamp(path.stat().st_mtime)
+            if season < current_season or age < timedelta(days=1):
+                return path
+        
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        url = self.PBP_URL.format(season=season)
+        logger.info(f"Downloading {url}...")
+        
+        tmp_path = path.with_suffix('.part')
+        try:
+            with requests.get(url, timeout=120, stream=True) as response:
+                response.raise_for_status()
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+            tmp_path.replace(path)
+        finally:
+            # Left behind only if the download failed
+            tmp_path.unlink(missing_ok=True)
+        
+        return path
+    
     def get_schedules(self, seasons: List[int]) -> pd.DataFrame:
         """Get game schedules with results."""
         if not self.nfl:
@@ -523,8 +989,10 @@ class RedditAPI:
     ⚠️  RATE LIMIT: Reasonable use
     """
     
+    CACHE_TTL = 60
+    
     def __init__(self):
-        self.session = requests.Session()
+        self.session = _build_session('reddit', self.CACHE_TTL)
         self.session.headers.update({
             'User-Agent': 'NFL-Betting-System/1.0'
         })
@@ -552,12 +1020,14 @@ class RedditAPI:
             
             logger.info(f"Fetching r/{subreddit} posts...")
             response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            if not response.ok:
+                logger.warning(f"Reddit API failed: {response.status_code}")
+                return []
             
-            data = response.json()
+            data = _json(response)
             return data['data']['children']
         
-        except Exception as e:
+        except API_ERRORS as e:
             logger.error(f"Reddit API error: {e}")
             return []
 
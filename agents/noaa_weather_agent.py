@@ -4,15 +4,122 @@ NOAA Weather Intelligence Agent
 Uses FREE government satellite/radar data for superior weather analysis.
 """
 
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import re
 import requests
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Optional, List, Tuple
 import logging
 
+if not __package__:
+    # Run as a script: make the project root importable, like scripts/ do
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.token_bucket import TokenBucket
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# NOAA wind strings: "10 mph", "5 to 10 mph" (group 2 is the upper bound)
+_WIND_RE = re.compile(r'(\d+)(?:\s*to\s*(\d+))?', re.I)
+
+# Used when a wind string has no speed in it
+DEFAULT_WIND_SPEED = 8
+
+# Shared by every agent in the process: bursts of 4, then 4 requests/sec,
+# under NOAA's ~5 req/s soft limit
+NOAA_RATE_LIMITER = TokenBucket(capacity=4, refill_rate=4.0)
+
+# ===== WEATHER EDGE TABLES =====
+# Each factor is a sorted threshold tuple plus one value per bucket, so the
+# edge is a sum of table lookups instead of if/elif ladders.
+
+# Wind (mph): 12+ moderate, 15+ significant, 20+ major (bisect_right)
+WIND_THRESHOLDS = (12, 15, 20)
+WIND_ADJUSTMENTS = (0.0, -2.0, -4.0, -6.5)
+WIND_UNDER_PROBS = (0.50, 0.56, 0.61, 0.65)
+WIND_CATEGORIES = ('NONE', 'MODERATE', 'SIGNIFICANT', 'MAJOR')
+
+# Temperature (F): <20 extreme cold, <30 cold (bisect_right)
+TEMP_THRESHOLDS = (20, 30)
+TEMP_ADJUSTMENTS = (-3.5, -1.5, 0.0)
+TEMP_UNDER_BUMPS = (0.06, 0.03, 0.0)
+
+# Precipitation (%): strictly above 60 (bisect_left)
+PRECIP_THRESHOLDS = (60,)
+PRECIP_ADJUSTMENTS = (0.0, -2.0)
+PRECIP_UNDER_BUMPS = (0.0, 0.04)
+
+
+def _json(response: requests.Response):
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(ts: str) -> datetime:
+    """Parse a NOAA ISO timestamp (cached: period bounds repeat across lookups)."""
+    if ts.endswith('Z'):
+        return datetime.fromisoformat(ts[:-1] + '+00:00')
+    return datetime.fromisoformat(ts)
+
+
+@dataclass(frozen=True)
+class StadiumArrays:
+    """Stadium columns as parallel arrays, for vectorized location queries."""
+    
+    names: np.ndarray
+    teams: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    is_dome: np.ndarray
+    
+    @classmethod
+    def from_dict(cls, stadiums: Dict[str, Dict]) -> StadiumArrays:
+        """Build from a STADIUMS-style {name: {lat, lon, team, roof}} dict."""
+        rows = stadiums.values()
+        return cls(
+            names=np.array(list(stadiums)),
+            teams=np.array([data['team'] for data in rows]),
+            lat=np.array([data['lat'] for data in rows]),
+            lon=np.array([data['lon'] for data in rows]),
+            is_dome=np.array([data.get('roof') == 'dome' for data in rows])
+        )
+    
+    def nearest(self, lat: float, lon: float) -> int:
+        """Index of the stadium closest to (lat, lon)."""
+        # Equirectangular approximation: shrink longitude by cos(latitude)
+        dlon = (self.lon - lon) * np.cos(np.radians(lat))
+        return int(np.argmin((self.lat - lat) ** 2 + dlon ** 2))
+
 
 class NOAAWeatherAgent:
     """
@@ -27,6 +134,27 @@ class NOAAWeatherAgent:
     
     NOAA_API = "https://api.weather.gov"
     
+    # Forecasts refresh roughly hourly; gridpoints never move
+    FORECAST_TTL = 900
+    FORECAST_URL_TTL = 7 * 24 * 3600
+    
+    # Gridpoint forecast URLs persist across runs
+    GRIDPOINT_CACHE_PATH = Path.home() / ".cache" / "nfl_noaa" / "gridpoints.json"
+    
+    # (connect, read) seconds
+    TIMEOUT = (5, 30)
+    
+    # Returned (as a copy) when NOAA is unavailable
+    FALLBACK_FORECAST = MappingProxyType({
+        'temperature': 55,  # Average
+        'wind_speed': 8,
+        'wind_direction': 'Variable',
+        'short_forecast': 'Unknown',
+        'precipitation_probability': 20,
+        'source': 'FALLBACK',
+        'confidence': 'LOW'
+    })
+    
     # NFL Stadium coordinates
     STADIUMS = {
         'Arrowhead Stadium': {'lat': 39.0489, 'lon': -94.4839, 'team': 'KC'},
@@ -42,18 +170,42 @@ class NOAAWeatherAgent:
         # ... Add all 30 stadiums
     }
     
+    # Team -> stadium data (with its name), for O(1) lookups
+    _STADIUMS_BY_TEAM = {
+        data['team']: {**data, 'name': name} for name, data in STADIUMS.items()
+    }
+    
+    # Same data column-wise, for nearest-stadium and other bulk queries
+    STADIUM_ARRAYS = StadiumArrays.from_dict(STADIUMS)
+    
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'NFL-Betting-Research (contact@example.com)'  # NOAA requires ID
+            'User-Agent': 'NFL-Betting-Research (contact@example.com)',  # NOAA requires ID
+            # Forecasts compress well; includes br when urllib3 can decode it
+            'Accept-Encoding': ACCEPT_ENCODING
         })
+        
+        # Keep connections for a full slate and retry NOAA's transient 5xx
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                                                   max_retries=retry))
+        
+        # key -> (fetched_at, value)
+        self._forecast_cache: Dict[tuple, tuple] = {}
+        self._gridpoint_save_lock = threading.Lock()
+        # Guards _forecast_url_cache between slate threads and snapshots
+        self._forecast_url_lock = threading.Lock()
+        self._forecast_url_cache: Dict[tuple, tuple] = self._load_gridpoint_cache()
     
     def get_stadium_location(self, team: str) -> Optional[Dict]:
         """Get stadium coordinates for team."""
-        for stadium, data in self.STADIUMS.items():
-            if data.get('team') == team:
-                return data
-        return None
+        return self._STADIUMS_BY_TEAM.get(team)
+    
+    def get_nearest_stadium(self, lat: float, lon: float) -> Dict:
+        """Get the stadium closest to a location (e.g. a radar grid cell)."""
+        idx = self.STADIUM_ARRAYS.nearest(lat, lon)
+        return self._STADIUMS_BY_TEAM[self.STADIUM_ARRAYS.teams[idx]]
     
     def get_forecast(self, lat: float, lon: float, game_time: datetime) -> Dict:
         """
@@ -67,79 +219,170 @@ class NOAAWeatherAgent:
         Returns:
             Dict with temperature, wind, precipitation
         """
+        # NOAA period bounds are offset-aware; treat naive times as local
+        if game_time.tzinfo is None:
+            game_time = game_time.astimezone()
+        
+        location = (round(lat, 3), round(lon, 3))
+        key = location + (game_time.replace(minute=0, second=0, microsecond=0).isoformat(),)
+        
+        cached = self._forecast_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.FORECAST_TTL:
+            return cached[1]
+        
         try:
-            # Step 1: Get gridpoint for location
-            points_url = f"{self.NOAA_API}/points/{lat},{lon}"
-            points_response = self.session.get(points_url)
-            
-            if points_response.status_code != 200:
-                logger.warning(f"NOAA points API failed: {points_response.status_code}")
+            # Step 1: Get gridpoint for location (cached, gridpoints are static)
+            forecast_url = self._get_forecast_url(*location)
+            if forecast_url is None:
                 return self._fallback_forecast(lat, lon)
             
-            points_data = points_response.json()
-            forecast_url = points_data['properties']['forecast']
-            
-            # Step 2: Get detailed forecast
-            forecast_response = self.session.get(forecast_url)
-            forecast_data = forecast_response.json()
+            # Step 2: Get detailed forecast (closed on error, too: it may be streamed)
+            with self._get(forecast_url, stream=ijson is not None) as forecast_response:
+                forecast_response.raise_for_status()
+                
+                # Find forecast period closest to game time
+                game_period = self._read_game_period(forecast_response, game_time)
             
-            # Find forecast period closest to game time
-            periods = forecast_data['properties']['periods']
-            game_period = self._find_closest_period(periods, game_time)
-            
-            return {
+            forecast = {
                 'temperature': game_period['temperature'],
                 'wind_speed': self._parse_wind(game_period['windSpeed']),
                 'wind_direction': game_period['windDirection'],
                 'short_forecast': game_period['shortForecast'],
                 'detailed_forecast': game_period['detailedForecast'],
-                'precipitation_probability': game_period.get('probabilityOfPrecipitation', {}).get('value', 0),
+                # NOAA sends {"value": null} when there is no chance of rain
+                'precipitation_probability': (game_period.get('probabilityOfPrecipitation') or {}).get('value') or 0,
                 'source': 'NOAA',
                 'confidence': 'HIGH'
             }
         
-        except Exception as e:
+        except (requests.RequestException, KeyError, IndexError, ValueError) as e:
             logger.error(f"NOAA API error: {e}")
             return self._fallback_forecast(lat, lon)
+        
+        # Fallbacks are not cached so the next call retries NOAA
+        self._forecast_cache[key] = (time.monotonic(), forecast)
+        return forecast
+    
+    def _get_forecast_url(self, lat: float, lon: float) -> Optional[str]:
+        """Resolve the gridpoint forecast URL for a location, or None on failure."""
+        cached = self._forecast_url_cache.get((lat, lon))
+        if cached and time.time() - cached[0] < self.FORECAST_URL_TTL:
+            return cached[1]
+        
+        points_url = f"{self.NOAA_API}/points/{lat},{lon}"
+        points_response = self._get(points_url)
+        
+        if points_response.status_code != 200:
+            logger.warning(f"NOAA points API failed: {points_response.status_code}")
+            return None
+        
+        forecast_url = _json(points_response)['properties']['forecast']
+        with self._forecast_url_lock:
+            self._forecast_url_cache[(lat, lon)] = (time.time(), forecast_url)
+        self._save_gridpoint_cache()
+        return forecast_url
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET from NOAA once the shared rate limiter allows it."""
+        while not NOAA_RATE_LIMITER.consume():
+            time.sleep(1 / NOAA_RATE_LIMITER.refill_rate)
+        return self.session.get(url, timeout=self.TIMEOUT, **kwargs)
+    
+    def _load_gridpoint_cache(self) -> Dict[tuple, tuple]:
+        """Load persisted (lat, lon) -> (fetched_at, forecast_url) entries."""
+        try:
+            with open(self.GRIDPOINT_CACHE_PATH) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        return {
+            tuple(float(x) for x in location.split(',')): (fetched_at, url)
+            for location, (fetched_at, url) in entries.items()
+        }
+    
+    def _save_gridpoint_cache(self):
+        """Persist gridpoint forecast URLs (best effort)."""
+        try:
+            self.GRIDPOINT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.GRIDPOINT_CACHE_PATH.with_suffix('.part')
+            with self._gridpoint_save_lock:
+                # Snapshot under both locks: inserts from slate threads wait,
+                # and a later write never carries an older snapshot
+                with self._forecast_url_lock:
+                    entries = {
+                        f"{lat},{lon}": [fetched_at, url]
+                        for (lat, lon), (fetched_at, url)
+                        in self._forecast_url_cache.items()
+                    }
+                with open(tmp_path, 'w') as f:
+                    json.dump(entries, f)
+                tmp_path.replace(self.GRIDPOINT_CACHE_PATH)
+        except OSError as e:
+            logger.warning(f"Could not save NOAA gridpoint cache: {e}")
     
     def _parse_wind(self, wind_str: str) -> int:
         """Parse wind speed from NOAA string."""
         # Examples: "10 mph", "5 to 10 mph", "10 to 15 mph"
+        # Take upper bound of a range: "10 to 15 mph" → 15
+        match = _WIND_RE.search(wind_str)
+        if match is None:
+            return DEFAULT_WIND_SPEED
+        return int(match.group(2) or match.group(1))
+    
+    @staticmethod
+    def parse_wind_series(wind_strs: pd.Series) -> pd.Series:
+        """Vectorized _parse_wind for bulk historical forecasts."""
+        parts = wind_strs.str.extract(_WIND_RE)
+        return parts[1].fillna(parts[0]).fillna(DEFAULT_WIND_SPEED).astype(int)
+    
+    def _read_game_period(self, response: requests.Response, game_time: datetime) -> Dict:
+        """
+        Pick the game's period out of a forecast response.
+        
+        With ijson installed the body is parsed as it streams in and parsing
+        stops at the game's period, instead of decoding all ~14 periods. The
+        rest of the body is still read (not parsed) so the keep-alive
+        connection can go back to the pool. Same choice as
+        _find_closest_period.
+        """
+        if ijson is None:
+            return self._find_closest_period(_json(response)['properties']['periods'], game_time)
+        
+        # Let urllib3 undo any gzip before ijson sees the bytes
+        response.raw.decode_content = True
+        game_period = None
+        
         try:
-            if 'to' in wind_str:
-                # Take upper bound: "10 to 15 mph" → 15
-                parts = wind_str.split('to')
-                speed = int(parts[1].strip().split()[0])
-            else:
-                speed = int(wind_str.split()[0])
-            return speed
-        except Exception:
-            return 8  # Default/average
+            for period in ijson.items(response.raw, 'properties.periods.item', use_float=True):
+                if game_period is not None and _parse_iso(period['startTime']) > game_time:
+                    break
+                game_period = period
+                if game_time < _parse_iso(period['endTime']):
+                    break
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid NOAA forecast JSON: {e}") from e
+        
+        # Closing a partly read response would drop its connection
+        response.raw.drain_conn()
+        response.raw.release_conn()
+        
+        if game_period is None:
+            raise KeyError('periods')
+        return game_period
     
     def _find_closest_period(self, periods: List, game_time: datetime) -> Dict:
         """Find forecast period closest to game time."""
-        for period in periods:
-            period_start = datetime.fromisoformat(period['startTime'].replace('Z', '+00:00'))
-            period_end = datetime.fromisoformat(period['endTime'].replace('Z', '+00:00'))
-            
-            if period_start <= game_time <= period_end:
-                return period
-        
-        # If exact match not found, return first period
-        return periods[0]
+        # Periods are contiguous and in order: take the last one starting at
+        # or before kickoff (the first if kickoff precedes them all)
+        starts = [_parse_iso(period['startTime']) for period in periods]
+        idx = bisect.bisect_right(starts, game_time) - 1
+        return periods[max(idx, 0)]
     
     def _fallback_forecast(self, lat: float, lon: float) -> Dict:
         """Fallback if NOAA API fails."""
         logger.warning("Using fallback weather forecast")
-        return {
-            'temperature': 55,  # Average
-            'wind_speed': 8,
-            'wind_direction': 'Variable',
-            'short_forecast': 'Unknown',
-            'precipitation_probability': 20,
-            'source': 'FALLBACK',
-            'confidence': 'LOW'
-        }
+        return dict(self.FALLBACK_FORECAST)
     
     def calculate_weather_edge(self, weather: Dict, market_total: float) -> Dict:
         """
@@ -150,39 +393,16 @@ class NOAAWeatherAgent:
         - Temp <25°F: Unders hit 56-58%
         - Combined: Unders hit 65%+
         """
-        wind = weather['wind_speed']
-        temp = weather['temperature']
-        
-        # Wind impact
-        if wind >= 20:
-            total_adjustment = -6.5
-            under_prob = 0.65
-            edge_category = 'MAJOR'
-        elif wind >= 15:
-            total_adjustment = -4.0
-            under_prob = 0.61
-            edge_category = 'SIGNIFICANT'
-        elif wind >= 12:
-            total_adjustment = -2.0
-            under_prob = 0.56
-            edge_category = 'MODERATE'
-        else:
-            total_adjustment = 0
-            under_prob = 0.50
-            edge_category = 'NONE'
-        
-        # Temperature impact (extreme cold)
-        if temp < 20:
-            total_adjustment -= 3.5
-            under_prob += 0.06
-        elif temp < 30:
-            total_adjustment -= 1.5
-            under_prob += 0.03
-        
-        # Precipitation impact
-        if weather['precipitation_probability'] > 60:
-            total_adjustment -= 2.0
-            under_prob += 0.04
+        wind_idx = bisect.bisect_right(WIND_THRESHOLDS, weather['wind_speed'])
+        temp_idx = bisect.bisect_right(TEMP_THRESHOLDS, weather['temperature'])
+        precip_idx = bisect.bisect_left(PRECIP_THRESHOLDS, weather['precipitation_probability'])
+        
+        # Wind, then extreme cold, then precipitation
+        total_adjustment = (WIND_ADJUSTMENTS[wind_idx] + TEMP_ADJUSTMENTS[temp_idx]
+                            + PRECIP_ADJUSTMENTS[precip_idx])
+        under_prob = (WIND_UNDER_PROBS[wind_idx] + TEMP_UNDER_BUMPS[temp_idx]
+                      + PRECIP_UNDER_BUMPS[precip_idx])
+        edge_category = WIND_CATEGORIES[wind_idx]
         
         # Calculate edge
         # Assume market adjusts total by ~50% of our adjustment
@@ -199,6 +419,50 @@ class NOAAWeatherAgent:
             'confidence': weather['confidence']
         }
     
+    def calculate_weather_edge_batch(self, weather_df: pd.DataFrame,
+                                     market_totals: np.ndarray) -> pd.DataFrame:
+        """
+        Vectorized calculate_weather_edge for a whole slate or backtest.
+        
+        Args:
+            weather_df: One row per game with wind_speed, temperature,
+                precipitation_probability (and optionally confidence)
+            market_totals: Market total per game
+            
+        Returns:
+            DataFrame with the same columns calculate_weather_edge returns,
+            aligned to weather_df's index
+        """
+        wind = weather_df['wind_speed'].to_numpy(dtype=float)
+        temp = weather_df['temperature'].to_numpy(dtype=float)
+        precip = weather_df['precipitation_probability'].fillna(0).to_numpy(dtype=float)
+        
+        wind_idx = np.searchsorted(WIND_THRESHOLDS, wind, side='right')
+        temp_idx = np.searchsorted(TEMP_THRESHOLDS, temp, side='right')
+        precip_idx = np.searchsorted(PRECIP_THRESHOLDS, precip, side='left')
+        
+        total_adjustment = (np.take(WIND_ADJUSTMENTS, wind_idx)
+                            + np.take(TEMP_ADJUSTMENTS, temp_idx)
+                            + np.take(PRECIP_ADJUSTMENTS, precip_idx))
+        under_prob = (np.take(WIND_UNDER_PROBS, wind_idx)
+                      + np.take(TEMP_UNDER_BUMPS, temp_idx)
+                      + np.take(PRECIP_UNDER_BUMPS, precip_idx))
+        edge_category = np.take(WIND_CATEGORIES, wind_idx)
+        
+        # Market assumed to move ~50% of our adjustment
+        market_adjustment = total_adjustment * 0.5
+        our_edge = np.abs(total_adjustment - market_adjustment)
+        
+        return pd.DataFrame({
+            'total_adjustment': total_adjustment,
+            'expected_market_adjustment': market_adjustment,
+            'edge_points': our_edge,
+            'under_probability': np.minimum(under_prob, 0.70),  # Cap at 70%
+            'edge_category': edge_category,
+            'recommendation': np.where(our_edge > 1.5, 'UNDER', 'NO_BET'),
+            'confidence': weather_df.get('confidence', 'HIGH')
+        }, index=weather_df.index)
+    
     def get_game_weather(self, team: str, game_time: datetime) -> Dict:
         """
         Get complete weather profile for game.
@@ -239,6 +503,35 @@ class NOAAWeatherAgent:
             'stadium': stadium,
         }
 
+    
+    def get_slate_weather(self, games: List[Tuple[str, datetime]],
+                          max_workers: int = 4) -> List[Dict]:
+        """
+        Get weather for a whole slate concurrently.
+        
+        Requests still go through the shared NOAA rate limiter, so this only
+        overlaps round-trips; it never exceeds NOAA's request rate.
+        
+        Args:
+            games: (home_team, game_time) per game
+            max_workers: Concurrent NOAA lookups
+            
+        Returns:
+            get_game_weather results in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda game: self.get_game_weather(*game), games))
+    
+    async def get_slate_weather_async(self, games: List[Tuple[str, datetime]],
+                                      max_workers: int = 4) -> List[Dict]:
+        """
+        get_slate_weather for async callers.
+        
+        Fetching and JSON decoding run in worker threads, so the event loop
+        stays free while a slate loads.
+        """
+        return await asyncio.to_thread(self.get_slate_weather, games, max_workers)
+
 
 if __name__ == '__main__':
     # Test the agent
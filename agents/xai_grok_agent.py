@@ -5,16 +5,42 @@ Grok is xAI's advanced reasoning AI with real-time data access.
 Perfect for analyzing game situations, sentiment, and making betting decisions.
 """
 
+import hashlib
 import json
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj) -> bytes:
+    """Encode a request body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(content: bytes):
+    """Decode a response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 class GrokAgent:
     """
     xAI Grok API Integration
@@ -29,6 +55,19 @@ class GrokAgent:
     
     BASE_URL = "https://api.x.ai/v1"
     
+    # Concurrent requests for chat_many (within the session's connection pool)
+    MAX_CONCURRENCY = 16
+    
+    # (connect, read) seconds
+    TIMEOUT = (5, 30)
+    
+    # Deterministic (temperature 0) responses kept in memory, LRU-evicted
+    CHAT_CACHE_SIZE = 1024
+    
+    # sentiment_analysis prompt budget
+    MAX_SENTIMENT_POSTS = 20
+    MAX_POST_CHARS = 280
+    
     def __init__(self, api_key: str):
         """
         Initialize Grok API client.
@@ -38,10 +77,24 @@ class GrokAgent:
         """
         self.api_key = api_key
         self.session = requests.Session()
+        # Everything chat sends is fixed here once, so requests has no
+        # per-call headers to merge (ACCEPT_ENCODING includes br when
+        # urllib3 can decode it)
         self.session.headers.update({
             'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Authorization': f'Bearer {api_key}'
         })
+        
+        # Reuse connections across concurrent chats; POSTs are only retried
+        # on connection errors, never on status codes
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                                                   max_retries=retry))
+        
+        self._chat_cache: OrderedDict = OrderedDict()
+        self._chat_cache_lock = threading.Lock()
     
     def chat(self, 
              messages: List[Dict[str, str]], 
@@ -69,14 +122,76 @@ class GrokAgent:
             'stream': stream
         }
         
+        # Only deterministic requests are safe to replay
+        cache_key = None
+        if not stream and temperature == 0.0:
+            cache_key = hashlib.blake2b(_dumps((model, temperature, messages))).hexdigest()
+            with self._chat_cache_lock:
+                if cache_key in self._chat_cache:
+                    self._chat_cache.move_to_end(cache_key)
+                    return self._chat_cache[cache_key]
+        
         try:
-            response = self.session.post(url, json=payload, timeout=30)
+            # Pre-encoded body; the session already sends Content-Type: application/json
+            response = self.session.post(url, data=_dumps(payload), timeout=self.TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            result = _loads(response.content)
         
         except Exception as e:
             logger.error(f"Grok API error: {e}")
             return {}
+        
+        if cache_key is not None:
+            with self._chat_cache_lock:
+                self._chat_cache[cache_key] = result
+                if len(self._chat_cache) > self.CHAT_CACHE_SIZE:
+                    self._chat_cache.popitem(last=False)
+        
+        return result
+    
+    def chat_many(self,
+                  message_lists: List[List[Dict[str, str]]],
+                  model: str = "grok-2-1212",
+                  temperature: float = 0.0) -> List[Dict]:
+        """
+        Send several chat completion requests concurrently.
+        
+        Args:
+            message_lists: One messages list per request
+            model: Model to use
+            temperature: 0.0 = deterministic, 1.0 = creative
+        
+        Returns:
+            Responses in input order ({} for failed requests)
+        """
+        if not message_lists:
+            return []
+        
+        workers = min(self.MAX_CONCURRENCY, len(message_lists))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda messages: self.chat(messages, model=model, temperature=temperature),
+                message_lists
+            ))
+    
+    def analyze_slate(self, games: List[Dict]) -> List[str]:
+        """
+        Get Grok's analysis for a whole slate of games concurrently.
+        
+        Args:
+            games: One dict per game with analyze_game's arguments
+                (home_team, away_team, and optional weather/injuries/odds)
+        
+        Returns:
+            Analyses in input order
+        """
+        responses = self.chat_many([self._game_messages(**game) for game in games])
+        
+        return [
+            response['choices'][0]['message']['content']
+            if response and 'choices' in response else "Unable to get Grok analysis"
+            for response in responses
+        ]
     
     def analyze_game(self, 
                     home_team: str, 
@@ -97,6 +212,22 @@ class GrokAgent:
         Returns:
             Grok's analysis and recommendations
         """
+        messages = self._game_messages(home_team, away_team, weather, injuries, odds)
+        
+        response = self.chat(messages, temperature=0.0)
+        
+        if response and 'choices' in response:
+            return response['choices'][0]['message']['content']
+        
+        return "Unable to get Grok analysis"
+    
+    def _game_messages(self,
+                       home_team: str,
+                       away_team: str,
+                       weather: Optional[Dict] = None,
+                       injuries: Optional[List] = None,
+                       odds: Optional[Dict] = None) -> List[Dict[str, str]]:
+        """Build the analyze_game chat messages."""
         # Build context
         context = f"Analyze this NFL game: {away_team} @ {home_team}\n\n"
         
@@ -111,7 +242,7 @@ class GrokAgent:
         
         context += "\nProvide: 1) Game analysis, 2) Key factors, 3) Betting edge opportunities"
         
-        messages = [
+        return [
             {
                 'role': 'system',
                 'content': 'You are an expert NFL analyst and betting advisor. Provide concise, data-driven insights.'
@@ -121,13 +252,6 @@ class GrokAgent:
                 'content': context
             }
         ]
-        
-        response = self.chat(messages, temperature=0.0)
-        
-        if response and 'choices' in response:
-            return response['choices'][0]['message']['content']
-        
-        return "Unable to get Grok analysis"
     
     def analyze_weather_edge(self, 
                             game: str,
@@ -186,7 +310,7 @@ Question: Does this weather create a betting edge on the total? If so, how many
         Returns:
             Sentiment analysis and betting implications
         """
-        posts_text = "\n".join(reddit_posts[:20])  # Limit to 20 posts
+        posts_text = "\n".join(self._prepare_posts(reddit_posts))
         
         prompt = f"""
 Analyze public betting sentiment for {team}:
@@ -210,6 +334,24 @@ Provide: 1) Sentiment score, 2) Public betting %, 3) Recommendation
         
         return "Unable to analyze sentiment"
     
+    def _prepare_posts(self, reddit_posts: List[str]) -> List[str]:
+        """Drop duplicate posts and truncate the rest to fit the prompt budget."""
+        seen = set()
+        posts = []
+        
+        for post in reddit_posts:
+            # Reposts/crossposts differ at most in case and whitespace
+            key = ' '.join(post[:200].lower().split())
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            posts.append(post[:self.MAX_POST_CHARS])
+            if len(posts) == self.MAX_SENTIMENT_POSTS:
+                break
+        
+        return posts
+    
     def line_shopping_analysis(self, 
                                game: str,
                                odds_by_book: Dict) -> str:
@@ -246,6 +388,35 @@ Question: Which book offers the best value? Calculate the edge vs average odds.
         
         return "Unable to analyze line shopping"
     
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _prediction_template(feature_keys: tuple) -> str:
+        """
+        Prediction prompt with the feature names baked in.
+        
+        Feature sets have a fixed schema per model, so each call only fills
+        in values: {0} is the away team, {1} the home team, then one slot per
+        feature.
+        """
+        metrics = "\n".join(
+            f"{str(key).replace('{', '{{').replace('}', '}}')}: {{{i}}}"
+            for i, key in enumerate(feature_keys, start=2)
+        )
+        
+        return f"""
+NFL Game Prediction: {{0}} @ {{1}}
+
+Key Metrics:
+{metrics}
+
+Provide:
+1. Winner prediction (with confidence %)
+2. Predicted score
+3. Key reasoning factors
+4. Betting recommendations (spread/total)
+5. Risk assessment
+"""
+    
     def predict_with_reasoning(self,
                               home_team: str,
                               away_team: str,
@@ -261,21 +432,8 @@ Question: Which book offers the best value? Calculate the edge vs average odds.
         Returns:
             Dict with prediction, confidence, reasoning
         """
-        features_text = "\n".join([f"{k}: {v}" for k, v in features.items()])
-        
-        prompt = f"""
-NFL Game Prediction: {away_team} @ {home_team}
-
-Key Metrics:
-{features_text}
-
-Provide:
-1. Winner prediction (with confidence %)
-2. Predicted score
-3. Key reasoning factors
-4. Betting recommendations (spread/total)
-5. Risk assessment
-"""
+        template = self._prediction_template(tuple(features))
+        prompt = template.format(away_team, home_team, *features.values())
         
         messages = [
             {'role': 'system', 'content': 'You are an expert NFL analyst with access to advanced metrics.'},
@@ -298,6 +456,8 @@ if __name__ == '__main__':
     # Test the Grok API
     import os
     
+    logging.basicConfig(level=logging.INFO)
+    
     API_KEY = 'your_xai_api_key_here'
     
     print("="*70)
@@ -0,0 +1 @@
+"""NFL Betting System - Streamlit Dashboard"""
@@ -11,43 +11,350 @@ Features:
 - System configuration
 """
 
+from __future__ import annotations
+
+import io
 import json
+import logging
+import multiprocessing
+import runpy
 import subprocess
 import sys
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass, replace
 from datetime import datetime
+from datetime import time as dt_time
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
-import pandas as pd
 import streamlit as st
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from dashboard.cache_scopes import PIPELINE, clear_scope
 
+# pandas is imported where a table is built, so loading the panel stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
 
-def advanced_settings_panel():
-    """Advanced settings panel with deep system controls."""
+# Worker processes kept alive for admin scripts
+SCRIPT_WORKERS = 2
+_script_pool_lock = threading.Lock()
 
-    st.header("🔧 Advanced System Controls")
-    st.caption("Admin-only: Deep configuration and automation")
+# Modules the scripts import from here are reloaded on every run
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
-    # Create tabs for different control sections
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(
-        [
-            "🤖 Bulldog AI",
-            "🎓 Model Training",
-            "📊 Features",
-            "🔄 Data Pipeline",
-            "⚡ Automation",
-            "🛠️ System",
-        ]
+# Detached jobs write here; the UI shows the last LOG_TAIL lines
+LOG_DIR = Path("logs")
+LOG_TAIL = 50
+
+# Quick Train is followed live; past the timeout it moves to the jobs panel
+QUICK_TRAIN_SCRIPT = "scripts/train_model.py"
+QUICK_TRAIN_TIMEOUT = 15 * 60
+
+
+def _warm_worker():
+    """Import the heavy libraries the scripts share, once per worker."""
+    import pandas  # noqa: F401
+
+
+def _is_project_module(module) -> bool:
+    """Whether module was loaded from this repo's sources (not a venv in it)."""
+    origin = getattr(module, "__file__", None)
+    return (
+        origin is not None
+        and "site-packages" not in origin
+        and Path(origin).resolve().is_relative_to(PROJECT_ROOT)
     )
 
-    # ======================================================================
-    # TAB 1: BULLDOG AI CONTROLS
-    # ======================================================================
 
-    with tab1:
-        st.subheader("🤖 Bulldog AI System")
-        st.info("""
+def _run_script(script: str, args: tuple) -> subprocess.CompletedProcess:
+    """Run a script as __main__ inside a worker, capturing its output."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = [script, *args]
+    # Scripts insert into sys.path on every run and import project modules;
+    # undo both so the path doesn't grow and edits are seen next run.
+    # Third-party imports stay loaded: they are what the warm worker is for.
+    saved_path = sys.path[:]
+    saved_modules = set(sys.modules)
+    # Scripts call logging.basicConfig, which is a no-op once the root logger
+    # has handlers: start each run bare so its logging lands in this stderr
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    root.handlers.clear()
+    returncode = 0
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            returncode = e.code
+        elif e.code is not None:
+            stderr.write(f"{e.code}\n")
+            returncode = 1
+    except Exception:
+        traceback.print_exc(file=stderr)
+        returncode = 1
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        for name in sys.modules.keys() - saved_modules:
+            if _is_project_module(sys.modules[name]):
+                del sys.modules[name]
+        for handler in root.handlers:
+            handler.close()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+    return subprocess.CompletedProcess(
+        [script, *args], returncode, stdout.getvalue(), stderr.getvalue()
+    )
+
+
+@lru_cache(maxsize=1)
+def _script_pool() -> ProcessPoolExecutor:
+    """
+    Shared pool for admin scripts.
+
+    Workers outlive each click, so interpreter startup and imports like
+    pandas are paid once per worker rather than once per button press.
+    Spawned (not forked) so workers don't inherit the server's threads.
+    """
+    return ProcessPoolExecutor(
+        max_workers=SCRIPT_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_warm_worker,
+    )
+
+
+def _retire_script_pool(pool: ProcessPoolExecutor, kill: bool = False):
+    """Stop handing out pool, so the next script gets a fresh one."""
+    with _script_pool_lock:
+        if _script_pool() is pool:
+            _script_pool.cache_clear()
+    if kill:
+        # The pool can't say which worker runs a given script, so all go
+        for process in list((pool._processes or {}).values()):
+            process.kill()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def follow_log(
+    path: Path,
+    is_running: Callable[[], bool],
+    tail: int = 20,
+    interval: float = 0.2,
+) -> Iterator[Tuple[Deque[str], int]]:
+    """
+    Follow a job's log file until the job exits.
+
+    Yields (last tail lines, total lines so far) at most once per interval,
+    and only when new output arrived, so callers redraw per batch rather
+    than per line. Any number of sessions can follow the same log.
+    """
+    lines: Deque[str] = deque(maxlen=tail)
+    count = 0
+    pending = b""
+    with open(path, "rb") as log:
+        while True:
+            # Checked before reading so the output written before exit is seen
+            running = is_running()
+            data = pending + log.read()
+            if not running and data and not data.endswith(b"\n"):
+                data += b"\n"  # The last line had no newline
+            if data:
+                *complete, pending = data.split(b"\n")
+                for raw in complete:
+                    lines.append(raw.decode(errors="replace").strip())
+                if complete:
+                    count += len(complete)
+                    yield lines, count
+            if not running:
+                return
+            time.sleep(interval)
+
+
+class JobRegistry:
+    """
+    Long-running admin jobs, at most one per script.
+
+    Starting a script that is still running returns the running process
+    instead of launching a second copy.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, subprocess.Popen] = {}
+        self._logs: Dict[str, Path] = {}
+
+    def start_detached(self, args: List[str]) -> Tuple[Path, bool]:
+        """
+        Start args in its own session with output sent to a new log file.
+
+        Nothing is buffered in this process, so the job's log volume doesn't
+        grow the server's memory. Returns (log path, started).
+        """
+        script = args[1]
+        with self._lock:
+            process = self._jobs.get(script)
+            if process is not None and process.poll() is None:
+                return self._logs[script], False
+            LOG_DIR.mkdir(exist_ok=True)
+            stamp = f"{datetime.now():%Y%m%d_%H%M%S}"
+            log_path = LOG_DIR / f"{Path(script).stem}_{stamp}.log"
+            with open(log_path, "w") as log:
+                process = subprocess.Popen(
+                    args,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True,
+                )
+            self._jobs[script] = process
+            self._logs[script] = log_path
+            return log_path, True
+
+    def status(self, script: str) -> Optional[int]:
+        """Return code of script's latest run, or None while it is running."""
+        with self._lock:
+            return self._jobs[script].poll()
+
+
+@st.cache_resource
+def _job_registry() -> JobRegistry:
+    """Job registry shared by every session in this server."""
+    return JobRegistry()
+
+
+def tail_log(path: Path, lines: int = LOG_TAIL) -> str:
+    """Last lines of a log file, read without loading the whole file."""
+    with open(path, errors="replace") as log:
+        return "".join(deque(log, maxlen=lines))
+
+
+def run_script(script: str, *args: str, timeout: float) -> subprocess.CompletedProcess:
+    """
+    Run a script in the warm worker pool and wait for its result.
+
+    Raises concurrent.futures.TimeoutError if it takes longer than timeout,
+    after killing the pool's workers so a hung script can't hold one. A
+    pool broken by a dead worker (including a script killed that way while
+    sharing the pool) is replaced and the script resubmitted once.
+    """
+    for attempt in range(2):
+        pool = _script_pool()
+        try:
+            return pool.submit(_run_script, script, args).result(timeout=timeout)
+        except BrokenProcessPool:
+            _retire_script_pool(pool)
+            if attempt:
+                raise
+        except FuturesTimeout:
+            _retire_script_pool(pool, kill=True)
+            raise
+
+
+@dataclass(frozen=True, slots=True)
+class Discovery:
+    """A strategy found by Bulldog edge discovery."""
+
+    strategy: str
+    edge: str
+    confidence: str
+    status: str
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduledTask:
+    """An automated job shown in the Automation tab."""
+
+    name: str
+    schedule: str
+    status: str
+    last_run: str
+
+
+DISCOVERIES = (
+    Discovery("Weather Underdog System", "+3.2%", "HIGH", "Testing"),
+    Discovery("Divisional Fade", "+2.1%", "MEDIUM", "Validated"),
+    Discovery("Primetime Home Dog", "+1.8%", "MEDIUM", "Testing"),
+)
+
+SCHEDULED_TASKS = (
+    ScheduledTask("Daily Predictions", "9:00 AM ET", "Active", "1 hour ago"),
+    ScheduledTask("Weekly Retrain", "Monday 3:00 AM", "Active", "2 days ago"),
+    ScheduledTask("Data Sync", "Every 6 hours", "Active", "3 hours ago"),
+    ScheduledTask("Bulldog Discovery", "Daily 2:00 AM", "Paused", "Never"),
+)
+
+
+DEFAULT_RETRAIN_TIME = dt_time(3, 0)
+
+# (label, value, delta) rows for the status tables
+MODEL_METRICS = (
+    ("Current Model", "XGBoost v2.1", ""),
+    ("Training Date", "Nov 20, 2025", ""),
+    ("Accuracy", "67.2%", ""),
+    ("Status", "Production", "Active"),
+)
+
+PIPELINE_METRICS = (
+    ("Last Update", "2 hours ago", ""),
+    ("Total Games", "2,476", ""),
+    ("Cache Status", "Valid", "Healthy"),
+    ("Data Quality", "98.5%", ""),
+    ("API Quota", "342/500", ""),
+    ("Storage", "1.2 GB", ""),
+)
+
+
+def _metrics_table(metrics: Tuple[Tuple[str, str, str], ...]):
+    """Render metric rows as one table rather than one st.metric each."""
+    import pandas as pd
+
+    st.dataframe(
+        pd.DataFrame(metrics, columns=["Metric", "Value", "Delta"]),
+        hide_index=True,
+        width="stretch",
+    )
+
+
+@dataclass(frozen=True)
+class AdminConfig:
+    """Admin settings that persist across reruns."""
+
+    bulldog_enabled: bool = False
+    auto_retrain: bool = False
+
+
+def _admin_config() -> AdminConfig:
+    """Current admin settings, stored as one session-state entry."""
+    return st.session_state.setdefault("admin_cfg", AdminConfig())
+
+
+def _update_admin_config(**changes):
+    """Store changed admin settings; a no-op when nothing changed."""
+    config = _admin_config()
+    updated = replace(config, **changes)
+    if updated != config:
+        st.session_state["admin_cfg"] = updated
+
+
+# ======================================================================
+# TAB 1: BULLDOG AI CONTROLS
+# ======================================================================
+
+
+@st.fragment
+def _tab_bulldog():
+    """Bulldog AI status, configuration and actions."""
+    st.subheader("🤖 Bulldog AI System")
+    st.info("""
         Bulldog is the self-improving AI that automatically:
         - Discovers new betting edges
         - Tests strategies in simulation
@@ -55,632 +362,750 @@ def advanced_settings_panel():
         - Optimizes performance
         """)
 
-        col1, col2 = st.columns(2)
+    col1, col2 = st.columns(2)
 
-        with col1:
-            st.markdown("### Status")
-            bulldog_enabled = st.toggle(
-                "Enable Bulldog AI",
-                value=st.session_state.get("bulldog_enabled", False),
-                help="Allow AI to autonomously improve system",
-            )
-            st.session_state["bulldog_enabled"] = bulldog_enabled
+    with col1:
+        st.markdown("### Status")
+        bulldog_enabled = st.toggle(
+            "Enable Bulldog AI",
+            value=_admin_config().bulldog_enabled,
+            help="Allow AI to autonomously improve system",
+        )
+        _update_admin_config(bulldog_enabled=bulldog_enabled)
+
+        if bulldog_enabled:
+            st.success("✅ Bulldog AI: ACTIVE")
+            st.metric("Active Experiments", "3")
+            st.metric("Success Rate", "78%")
+        else:
+            st.warning("⏸️ Bulldog AI: PAUSED")
+
+    with col2:
+        st.markdown("### Configuration")
+
+        exploration_rate = st.slider(
+            "Exploration Rate",
+            min_value=0.0,
+            max_value=1.0,
+            value=0.3,
+            step=0.05,
+            help="How aggressively to try new strategies",
+        )
 
-            if bulldog_enabled:
-                st.success("✅ Bulldog AI: ACTIVE")
-                st.metric("Active Experiments", "3")
-                st.metric("Success Rate", "78%")
-            else:
-                st.warning("⏸️ Bulldog AI: PAUSED")
+        min_edge_threshold = st.slider(
+            "Min Edge Threshold",
+            min_value=0.00,
+            max_value=0.10,
+            value=0.02,
+            step=0.005,
+            format="%.1f%%",
+            help="Minimum edge to consider a strategy",
+        )
 
-        with col2:
-            st.markdown("### Configuration")
-
-            exploration_rate = st.slider(
-                "Exploration Rate",
-                min_value=0.0,
-                max_value=1.0,
-                value=0.3,
-                step=0.05,
-                help="How aggressively to try new strategies",
-            )
+        max_experiments = st.number_input(
+            "Max Parallel Experiments",
+            min_value=1,
+            max_value=10,
+            value=3,
+            help="Number of strategies to test simultaneously",
+        )
 
-            min_edge_threshold = st.slider(
-                "Min Edge Threshold",
-                min_value=0.00,
-                max_value=0.10,
-                value=0.02,
-                step=0.005,
-                format="%.1f%%",
-                help="Minimum edge to consider a strategy",
-            )
+    st.divider()
 
-            max_experiments = st.number_input(
-                "Max Parallel Experiments",
-                min_value=1,
-                max_value=10,
-                value=3,
-                help="Number of strategies to test simultaneously",
-            )
+    # Bulldog Actions
+    st.markdown("### 🎯 Actions")
 
-        st.divider()
+    col1, col2, col3 = st.columns(3)
 
-        # Bulldog Actions
-        st.markdown("### 🎯 Actions")
+    with col1:
+        if st.button("🔍 Discover New Edges", width="stretch"):
+            with st.spinner("Running edge discovery..."):
+                try:
+                    result = run_script("scripts/bulldog_edge_discovery.py", timeout=60)
+                    if result.returncode == 0:
+                        st.success("✅ Edge discovery complete!")
+                        st.code(result.stdout)
+                    else:
+                        st.error(f"❌ Error: {result.stderr}")
+                except FuturesTimeout:
+                    st.warning("⏱️ Still running... Check logs")
+                except Exception as e:
+                    st.error(f"❌ Error: {str(e)}")
+
+    with col2:
+        if st.button("📊 Run Backtest", width="stretch"):
+            with st.spinner("Running backtest..."):
+                try:
+                    result = run_script("scripts/bulldog_backtest.py", timeout=120)
+                    if result.returncode == 0:
+                        st.success("✅ Backtest complete!")
+                        st.code(result.stdout)
+                    else:
+                        st.error(f"❌ Error: {result.stderr}")
+                except Exception as e:
+                    st.error(f"❌ Error: {str(e)}")
+
+    with col3:
+        if st.button("🎨 Generate Report", width="stretch"):
+            with st.spinner("Generating report..."):
+                try:
+                    result = run_script("scripts/bulldog_reports.py", timeout=60)
+                    if result.returncode == 0:
+                        st.success("✅ Report generated!")
+                        st.markdown("[View Report](reports/bulldog_report.html)")
+                    else:
+                        st.error(f"❌ Error: {result.stderr}")
+                except Exception as e:
+                    st.error(f"❌ Error: {str(e)}")
 
-        col1, col2, col3 = st.columns(3)
+    # Recent Discoveries
+    st.divider()
+    st.markdown("### 🔬 Recent Discoveries")
 
-        with col1:
-            if st.button("🔍 Discover New Edges", width="stretch"):
-                with st.spinner("Running edge discovery..."):
-                    try:
-                        result = subprocess.run(
-                            [sys.executable, "scripts/bulldog_edge_discovery.py"],
-                            capture_output=True,
-                            text=True,
-                            timeout=60,
-                        )
-                        if result.returncode == 0:
-                            st.success("✅ Edge discovery complete!")
-                            st.code(result.stdout)
-                        else:
-                            st.error(f"❌ Error: {result.stderr}")
-                    except subprocess.TimeoutExpired:
-                        st.warning("⏱️ Still running... Check logs")
-                    except Exception as e:
-                        st.error(f"❌ Error: {str(e)}")
+    for disc in DISCOVERIES:
+        with st.expander(f"{disc.strategy} - Edge: {disc.edge}", expanded=False):
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Confidence", disc.confidence)
+            col2.metric("Status", disc.status)
+            col3.metric("Expected Edge", disc.edge)
 
-        with col2:
-            if st.button("📊 Run Backtest", width="stretch"):
-                with st.spinner("Running backtest..."):
-                    try:
-                        result = subprocess.run(
-                            [sys.executable, "scripts/bulldog_backtest.py"],
-                            capture_output=True,
-                            text=True,
-                            timeout=120,
-                        )
-                        if result.returncode == 0:
-                            st.success("✅ Backtest complete!")
-                            st.code(result.stdout)
-                        else:
-                            st.error(f"❌ Error: {result.stderr}")
-                    except Exception as e:
-                        st.error(f"❌ Error: {str(e)}")
+            if st.button(f"Deploy {disc.strategy}", key=disc.strategy):
+                st.success(f"✅ Deploying {disc.strategy} to production!")
 
-        with col3:
-            if st.button("🎨 Generate Report", width="stretch"):
-                with st.spinner("Generating report..."):
-                    try:
-                        result = subprocess.run(
-                            [sys.executable, "scripts/bulldog_reports.py"],
-                            capture_output=True,
-                            text=True,
-                            timeout=60,
-                        )
-                        if result.returncode == 0:
-                            st.success("✅ Report generated!")
-                            st.markdown("[View Report](reports/bulldog_report.html)")
-                        else:
-                            st.error(f"❌ Error: {result.stderr}")
-                    except Exception as e:
-                        st.error(f"❌ Error: {str(e)}")
 
-        # Recent Discoveries
-        st.divider()
-        st.markdown("### 🔬 Recent Discoveries")
+# ======================================================================
+# TAB 2: MODEL TRAINING CONTROLS
+# ======================================================================
 
-        discoveries = [
-            {
-                "strategy": "Weather Underdog System",
-                "edge": "+3.2%",
-                "confidence": "HIGH",
-                "status": "Testing",
-            },
-            {
-                "strategy": "Divisional Fade",
-                "edge": "+2.1%",
-                "confidence": "MEDIUM",
-                "status": "Validated",
-            },
-            {
-                "strategy": "Primetime Home Dog",
-                "edge": "+1.8%",
-                "confidence": "MEDIUM",
-                "status": "Testing",
-            },
-        ]
 
-        for disc in discoveries:
-            with st.expander(
-                f"{disc['strategy']} - Edge: {disc['edge']}", expanded=False
-            ):
-                col1, col2, col3 = st.columns(3)
-                col1.metric("Confidence", disc["confidence"])
-                col2.metric("Status", disc["status"])
-                col3.metric("Expected Edge", disc["edge"])
+# Model comparison: (model, accuracy %, ROI %, Sharpe)
+MODEL_COMPARISON = (
+    ("Current XGBoost", 67.2, 428, 5.0),
+    ("New XGBoost", 68.5, 445, 5.3),
+    ("LightGBM", 66.8, 398, 4.7),
+    ("Ensemble", 69.1, 467, 5.6),
+)
 
-                if st.button(f"Deploy {disc['strategy']}", key=disc["strategy"]):
-                    st.success(f"✅ Deploying {disc['strategy']} to production!")
 
-    # ======================================================================
-    # TAB 2: MODEL TRAINING CONTROLS
-    # ======================================================================
+@st.cache_data
+def _model_comparison_df() -> pd.DataFrame:
+    """Model comparison table, built once per process."""
+    import pandas as pd
 
-    with tab2:
-        st.subheader("🎓 Model Training & Management")
+    return pd.DataFrame.from_records(
+        MODEL_COMPARISON, columns=["Model", "Accuracy", "ROI", "Sharpe"]
+    ).astype({"Accuracy": "float32", "ROI": "float32", "Sharpe": "float32"})
 
-        # Current Model Stats
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Current Model", "XGBoost v2.1")
-        with col2:
-            st.metric("Training Date", "Nov 20, 2025")
-        with col3:
-            st.metric("Accuracy", "67.2%")
-        with col4:
-            st.metric("Status", "Production", delta="Active")
 
-        st.divider()
+# Model version history, stored compactly: accuracy in tenths of a percent
+MODEL_HISTORY_PATH = Path(__file__).parent.parent / "models" / "history.parquet"
 
-        # Training Configuration
-        st.markdown("### 🎛️ Training Configuration")
 
-        col1, col2 = st.columns(2)
+def write_model_history(history: pd.DataFrame, path: Path = MODEL_HISTORY_PATH):
+    """Store a model history table (Accuracy in percent) as compact Parquet."""
+    compact = history.assign(
+        Accuracy=(history["Accuracy"] * 10).round().astype("int16"),
+        ROI=history["ROI"].astype("int16"),
+        Status=history["Status"].astype("category"),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    compact.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
 
-        with col1:
-            st.markdown("**Data Selection**")
 
-            seasons = st.multiselect(
-                "Seasons to Include",
-                options=[2016, 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024],
-                default=[2020, 2021, 2022, 2023, 2024],
-                help="Select seasons for training data",
-            )
+@st.cache_data(ttl=3600)
+def _model_history_df() -> pd.DataFrame:
+    """Model version history, memory-mapped from MODEL_HISTORY_PATH."""
+    import pandas as pd
 
-            features_mode = st.radio(
-                "Feature Set",
-                ["All Features (44)", "Core Only (18)", "Custom Selection"],
-                help="Choose which features to use",
+    if not MODEL_HISTORY_PATH.exists():
+        # Seed the file with the versions shipped so far
+        try:
+            write_model_history(
+                pd.DataFrame(
+                    {
+                        "Version": ["v2.1", "v2.0", "v1.9", "v1.8"],
+                        "Date": [
+                            "2025-11-20",
+                            "2025-11-13",
+                            "2025-11-06",
+                            "2025-10-30",
+                        ],
+                        "Accuracy": [67.2, 66.8, 66.5, 65.9],
+                        "ROI": [428, 415, 402, 395],
+                        "Status": ["Production", "Archived", "Archived", "Archived"],
+                    }
+                )
             )
-
-            validation_split = st.slider(
-                "Validation Split",
-                min_value=0.1,
-                max_value=0.4,
-                value=0.2,
-                step=0.05,
-                format="%.0f%%",
+        except OSError:
+            return pd.DataFrame(
+                columns=["Version", "Date", "Accuracy", "ROI", "Status"]
             )
 
-        with col2:
-            st.markdown("**Model Parameters**")
+    history = pd.read_parquet(MODEL_HISTORY_PATH, engine="pyarrow", memory_map=True)
+    # Back to percent only for display
+    return history.assign(Accuracy=history["Accuracy"] / 10)
+
+
+def _start_detached_job(title: str, script: str):
+    """Launch a long job in the background and watch it from this session."""
+    try:
+        log_path, started = _job_registry().start_detached([sys.executable, script])
+    except OSError as e:
+        st.error(f"❌ Error: {str(e)}")
+        return
+
+    st.session_state.setdefault("detached_jobs", {})[script] = (title, str(log_path))
+    if not started:
+        st.info(f"⏱️ {title} already running, following its log")
+
+
+@st.fragment(run_every=5)
+def _detached_jobs_panel():
+    """Poll this session's background jobs and show their log tails."""
+    jobs = st.session_state.get("detached_jobs", {})
+    for script, (title, log_path) in list(jobs.items()):
+        try:
+            returncode = _job_registry().status(script)
+        except KeyError:
+            # The registry was rebuilt; that run can no longer be polled
+            del jobs[script]
+            continue
+        with st.expander(f"{title} Log", expanded=True):
+            st.code(tail_log(Path(log_path)))
+            if returncode is None:
+                st.info(f"⏱️ {title} in progress...")
+            elif returncode == 0:
+                st.success(f"✅ {title} complete!")
+            else:
+                st.error(f"❌ {title} failed (exit code {returncode})")
+        if returncode is not None and st.button("Dismiss", key=f"dismiss_{script}"):
+            del jobs[script]
+            st.rerun(scope="fragment")
 
-            model_type = st.selectbox(
-                "Model Type",
-                ["XGBoost (Recommended)", "LightGBM (Fast)", "Ensemble (Best)"],
-                help="Choose model architecture",
-            )
 
-            n_estimators = st.number_input(
-                "Number of Estimators", min_value=50, max_value=500, value=200, step=50
-            )
+@st.fragment
+def _tab_training():
+    """Model training configuration, actions and history."""
+    st.subheader("🎓 Model Training & Management")
 
-            learning_rate = st.number_input(
-                "Learning Rate",
-                min_value=0.01,
-                max_value=0.3,
-                value=0.05,
-                step=0.01,
-                format="%.2f",
-            )
+    # Current Model Stats
+    _metrics_table(MODEL_METRICS)
 
-            max_depth = st.slider("Max Tree Depth", min_value=3, max_value=10, value=6)
+    st.divider()
 
-        st.divider()
+    # Training Configuration
+    st.markdown("### 🎛️ Training Configuration")
 
-        # Training Actions
-        st.markdown("### 🚀 Training Actions")
+    col1, col2 = st.columns(2)
 
-        col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown("**Data Selection**")
 
-        with col1:
-            if st.button(
-                "🎯 Quick Train", width="stretch", help="Fast training (5 min)"
-            ):
-                with st.spinner("🎓 Training model..."):
-                    with st.expander("Training Log", expanded=True):
-                        progress = st.progress(0)
-                        log = st.empty()
-
-                        try:
-                            process = subprocess.Popen(
-                                [sys.executable, "scripts/train_model.py"],
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.STDOUT,
-                                text=True,
-                                bufsize=1,
-                            )
-
-                            output = []
-                            for i, line in enumerate(process.stdout):
-                                output.append(line.strip())
-                                log.code("\n".join(output[-20:]))  # Last 20 lines
-                                progress.progress(min((i + 1) * 0.05, 0.99))
-
-                            process.wait()
-                            progress.progress(1.0)
+        seasons = st.multiselect(
+            "Seasons to Include",
+            options=[2016, 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024],
+            default=[2020, 2021, 2022, 2023, 2024],
+            help="Select seasons for training data",
+        )
 
-                            if process.returncode == 0:
-                                st.success("✅ Training complete!")
-                                st.balloons()
-                            else:
-                                st.error("❌ Training failed. Check logs.")
+        features_mode = st.radio(
+            "Feature Set",
+            ["All Features (44)", "Core Only (18)", "Custom Selection"],
+            help="Choose which features to use",
+        )
 
-                        except Exception as e:
-                            st.error(f"❌ Error: {str(e)}")
+        validation_split = st.slider(
+            "Validation Split",
+            min_value=0.1,
+            max_value=0.4,
+            value=0.2,
+            step=0.05,
+            format="%.0f%%",
+        )
 
-        with col2:
-            if st.button(
-                "🔬 Deep Train", width="stretch", help="Full training (30 min)"
-            ):
-                with st.spinner("🧬 Deep training in progress..."):
-                    try:
-                        result = subprocess.run(
-                            [sys.executable, "scripts/train_improved_model.py"],
-                            capture_output=True,
-                            text=True,
-                            timeout=1800,
-                        )
-                        if result.returncode == 0:
-                            st.success("✅ Deep training complete!")
-                        else:
-                            st.error(f"❌ Error: {result.stderr}")
-                    except subprocess.TimeoutExpired:
-                        st.info("⏱️ Still training... Check system logs")
+    with col2:
+        st.markdown("**Model Parameters**")
 
-        with col3:
-            if st.button(
-                "🎨 Tune Hyperparameters",
-                width="stretch",
-                help="Optimize settings (1 hour)",
-            ):
-                with st.spinner("🎯 Running Optuna optimization..."):
-                    try:
-                        result = subprocess.run(
-                            [sys.executable, "scripts/tune_hyperparameters.py"],
-                            capture_output=True,
-                            text=True,
-                            timeout=3600,
-                        )
-                        if result.returncode == 0:
-                            st.success("✅ Hyperparameter tuning complete!")
-                            st.json({"best_params": "See logs"})
-                        else:
-                            st.error("❌ Error occurred")
-                    except subprocess.TimeoutExpired:
-                        st.info("⏱️ Still optimizing...")
+        model_type = st.selectbox(
+            "Model Type",
+            ["XGBoost (Recommended)", "LightGBM (Fast)", "Ensemble (Best)"],
+            help="Choose model architecture",
+        )
 
-        with col4:
-            if st.button("📊 Compare Models", width="stretch", help="A/B test models"):
-                st.info("🔄 Running model comparison...")
+        n_estimators = st.number_input(
+            "Number of Estimators", min_value=50, max_value=500, value=200, step=50
+        )
 
-                comparison = pd.DataFrame(
-                    {
-                        "Model": [
-                            "Current XGBoost",
-                            "New XGBoost",
-                            "LightGBM",
-                            "Ensemble",
-                        ],
-                        "Accuracy": [67.2, 68.5, 66.8, 69.1],
-                        "ROI": [428, 445, 398, 467],
-                        "Sharpe": [5.0, 5.3, 4.7, 5.6],
-                    }
-                )
+        learning_rate = st.number_input(
+            "Learning Rate",
+            min_value=0.01,
+            max_value=0.3,
+            value=0.05,
+            step=0.01,
+            format="%.2f",
+        )
 
-                st.dataframe(comparison, width="stretch")
-                st.success("✅ Ensemble model performs best!")
+        max_depth = st.slider("Max Tree Depth", min_value=3, max_value=10, value=6)
 
-        st.divider()
+    st.divider()
 
-        # Auto-Retrain Schedule
-        st.markdown("### ⏰ Auto-Retrain Schedule")
+    # Training Actions
+    st.markdown("### 🚀 Training Actions")
 
-        auto_retrain = st.toggle(
-            "Enable Automatic Retraining",
-            value=st.session_state.get("auto_retrain", False),
-            help="Automatically retrain model weekly",
-        )
+    col1, col2, col3, col4 = st.columns(4)
 
-        if auto_retrain:
-            col1, col2 = st.columns(2)
-            with col1:
-                retrain_day = st.selectbox(
-                    "Retrain Day",
-                    [
-                        "Monday",
-                        "Tuesday",
-                        "Wednesday",
-                        "Thursday",
-                        "Friday",
-                        "Saturday",
-                        "Sunday",
-                    ],
-                    index=0,
-                )
-            with col2:
-                retrain_time = st.time_input(
-                    "Retrain Time", value=datetime.strptime("03:00", "%H:%M").time()
-                )
+    with col1:
+        if st.button("🎯 Quick Train", width="stretch", help="Fast training (5 min)"):
+            with st.spinner("🎓 Training model..."):
+                with st.expander("Training Log", expanded=True):
+                    progress = st.progress(0)
+                    log = st.empty()
 
-            st.success(
-                f"✅ Auto-retrain scheduled: Every {retrain_day} at {retrain_time}"
+                    try:
+                        registry = _job_registry()
+                        log_path, started = registry.start_detached(
+                            [sys.executable, QUICK_TRAIN_SCRIPT]
+                        )
+                        if not started:
+                            st.info("⏱️ Quick Train already running, following its log")
+
+                        # One redraw per batch of output, not per line
+                        deadline = time.monotonic() + QUICK_TRAIN_TIMEOUT
+                        for tail, count in follow_log(
+                            log_path,
+                            lambda: registry.status(QUICK_TRAIN_SCRIPT) is None
+                            and time.monotonic() < deadline,
+                        ):
+                            log.code("\n".join(tail))  # Last 20 lines
+                            progress.progress(min(count * 0.05, 0.99))
+
+                        returncode = registry.status(QUICK_TRAIN_SCRIPT)
+                        if returncode is None:
+                            # Still going: hand it to the background jobs panel
+                            st.session_state.setdefault("detached_jobs", {})[
+                                QUICK_TRAIN_SCRIPT
+                            ] = ("Quick Train", str(log_path))
+                            st.warning("⏱️ Quick Train is taking longer than expected")
+                        elif returncode == 0:
+                            progress.progress(1.0)
+                            st.success("✅ Training complete!")
+                            st.balloons()
+                        else:
+                            st.error("❌ Training failed. Check logs.")
+
+                    except Exception as e:
+                        st.error(f"❌ Error: {str(e)}")
+
+    with col2:
+        if st.button("🔬 Deep Train", width="stretch", help="Full training (30 min)"):
+            _start_detached_job("Deep training", "scripts/train_improved_model.py")
+
+    with col3:
+        if st.button(
+            "🎨 Tune Hyperparameters",
+            width="stretch",
+            help="Optimize settings (1 hour)",
+        ):
+            _start_detached_job(
+                "Hyperparameter tuning", "scripts/tune_hyperparameters.py"
+            )
+
+    with col4:
+        if st.button("📊 Compare Models", width="stretch", help="A/B test models"):
+            st.info("🔄 Running model comparison...")
+
+            comparison = _model_comparison_df()
+            st.dataframe(
+                comparison,
+                column_config={
+                    # float32 values print with float noise unless formatted
+                    "Accuracy": st.column_config.NumberColumn(format="%.1f%%"),
+                    "ROI": st.column_config.NumberColumn(format="%.0f%%"),
+                    "Sharpe": st.column_config.NumberColumn(format="%.1f"),
+                },
+                hide_index=True,
+                width="stretch",
             )
+            st.bar_chart(comparison, x="Model", y="Accuracy")
+            st.success("✅ Ensemble model performs best!")
 
-        st.divider()
+    _detached_jobs_panel()
 
-        # Model History
-        st.markdown("### 📜 Model History")
+    st.divider()
 
-        history = pd.DataFrame(
+    # Auto-Retrain Schedule
+    st.markdown("### ⏰ Auto-Retrain Schedule")
+
+    auto_retrain = st.toggle(
+        "Enable Automatic Retraining",
+        value=_admin_config().auto_retrain,
+        help="Automatically retrain model weekly",
+    )
+    _update_admin_config(auto_retrain=auto_retrain)
+
+    if auto_retrain:
+        col1, col2 = st.columns(2)
+        with col1:
+            retrain_day = st.selectbox(
+                "Retrain Day",
+                [
+                    "Monday",
+                    "Tuesday",
+                    "Wednesday",
+                    "Thursday",
+                    "Friday",
+                    "Saturday",
+                    "Sunday",
+                ],
+                index=0,
+            )
+        with col2:
+            retrain_time = st.time_input("Retrain Time", value=DEFAULT_RETRAIN_TIME)
+
+        st.success(f"✅ Auto-retrain scheduled: Every {retrain_day} at {retrain_time}")
+
+    st.divider()
+
+    # Model History
+    st.markdown("### 📜 Model History")
+
+    st.dataframe(_model_history_df(), width="stretch")
+
+
+# ======================================================================
+# TAB 3: FEATURE MANAGEMENT
+# ======================================================================
+
+
+# Feature categories shown in the Features tab
+FEATURE_CATEGORIES = {
+    "Elo Ratings": ["elo_home", "elo_away", "elo_diff", "elo_prob_home"],
+    "Rest Days": [
+        "rest_days_home",
+        "rest_days_away",
+        "is_back_to_back_home",
+        "is_back_to_back_away",
+        "post_bye_home",
+        "post_bye_away",
+    ],
+    "Weather": ["temp", "wind", "is_dome", "is_cold", "is_windy"],
+    "Form": [
+        "win_pct_home",
+        "win_pct_away",
+        "point_diff_home",
+        "point_diff_away",
+    ],
+    "Advanced": [
+        "referee_penalty_rate",
+        "home_field_advantage",
+        "divisional_game",
+    ],
+}
+
+# Importance shown next to each feature (fixed: not derived per process)
+FEATURE_IMPORTANCE = {
+    "elo_home": 0.12,
+    "elo_away": 0.11,
+    "elo_diff": 0.24,
+    "elo_prob_home": 0.22,
+    "rest_days_home": 0.08,
+    "rest_days_away": 0.08,
+    "is_back_to_back_home": 0.06,
+    "is_back_to_back_away": 0.06,
+    "post_bye_home": 0.07,
+    "post_bye_away": 0.07,
+    "temp": 0.09,
+    "wind": 0.13,
+    "is_dome": 0.10,
+    "is_cold": 0.07,
+    "is_windy": 0.11,
+    "win_pct_home": 0.15,
+    "win_pct_away": 0.14,
+    "point_diff_home": 0.18,
+    "point_diff_away": 0.17,
+    "referee_penalty_rate": 0.05,
+    "home_field_advantage": 0.16,
+    "divisional_game": 0.09,
+}
+
+
+@st.cache_data
+def _feature_table() -> pd.DataFrame:
+    """One row per feature with its category, enabled flag and importance."""
+    import pandas as pd
+
+    return pd.DataFrame(
+        [
             {
-                "Version": ["v2.1", "v2.0", "v1.9", "v1.8"],
-                "Date": ["2025-11-20", "2025-11-13", "2025-11-06", "2025-10-30"],
-                "Accuracy": [67.2, 66.8, 66.5, 65.9],
-                "ROI": [428, 415, 402, 395],
-                "Status": ["Production", "Archived", "Archived", "Archived"],
+                "category": category,
+                "feature": feature,
+                "enabled": True,
+                "importance": FEATURE_IMPORTANCE[feature],
             }
-        )
+            for category, features in FEATURE_CATEGORIES.items()
+            for feature in features
+        ]
+    )
 
-        st.dataframe(history, width="stretch")
 
-    # ======================================================================
-    # TAB 3: FEATURE MANAGEMENT
-    # ======================================================================
+@st.fragment
+def _tab_features():
+    """Feature toggles and feature discovery."""
+    st.subheader("📊 Feature Engineering Controls")
+
+    st.markdown("### 🎛️ Active Features (44 total)")
+
+    features = _feature_table()
+    edited = st.data_editor(
+        features,
+        column_config={
+            "enabled": st.column_config.CheckboxColumn("Enabled"),
+            "importance": st.column_config.NumberColumn("Importance", format="%.3f"),
+        },
+        disabled=["category", "feature", "importance"],
+        hide_index=True,
+        key="feature_table",
+        width="stretch",
+    )
 
-    with tab3:
-        st.subheader("📊 Feature Engineering Controls")
-
-        st.markdown("### 🎛️ Active Features (44 total)")
-
-        # Feature categories
-        categories = {
-            "Elo Ratings": ["elo_home", "elo_away", "elo_diff", "elo_prob_home"],
-            "Rest Days": [
-                "rest_days_home",
-                "rest_days_away",
-                "is_back_to_back_home",
-                "is_back_to_back_away",
-                "post_bye_home",
-                "post_bye_away",
-            ],
-            "Weather": ["temp", "wind", "is_dome", "is_cold", "is_windy"],
-            "Form": [
-                "win_pct_home",
-                "win_pct_away",
-                "point_diff_home",
-                "point_diff_away",
-            ],
-            "Advanced": [
-                "referee_penalty_rate",
-                "home_field_advantage",
-                "divisional_game",
-            ],
-        }
-
-        for category, features in categories.items():
-            with st.expander(f"{category} ({len(features)} features)", expanded=False):
-                for feature in features:
-                    col1, col2, col3 = st.columns([2, 1, 1])
-                    with col1:
-                        enabled = st.checkbox(
-                            feature, value=True, key=f"feat_{feature}"
-                        )
-                    with col2:
-                        st.caption(f"Importance: {0.05 + hash(feature) % 20 / 100:.3f}")
-                    with col3:
-                        if st.button("📊", key=f"plot_{feature}"):
-                            st.info(f"Showing distribution for {feature}")
+    disabled = features["feature"][features["enabled"] & ~edited["enabled"]]
+    if len(disabled):
+        st.caption(f"Disabled: {', '.join(disabled)}")
 
-        st.divider()
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        selected = st.selectbox(
+            "Feature", features["feature"], label_visibility="collapsed"
+        )
+    with col2:
+        if st.button("📊 Distribution", width="stretch"):
+            st.info(f"Showing distribution for {selected}")
 
-        # Feature Discovery
-        st.markdown("### 🔬 Feature Discovery")
+    st.divider()
 
-        col1, col2 = st.columns(2)
+    # Feature Discovery
+    st.markdown("### 🔬 Feature Discovery")
 
-        with col1:
-            if st.button("🧬 Genetic Feature Search", width="stretch"):
-                with st.spinner("Running genetic programming..."):
-                    st.info("🔬 Discovering novel features...")
-                    st.success("✅ Found 3 new promising features!")
-                    st.code("""
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if st.button("🧬 Genetic Feature Search", width="stretch"):
+            with st.spinner("Running genetic programming..."):
+                st.info("🔬 Discovering novel features...")
+                st.success("✅ Found 3 new promising features!")
+                st.code("""
 New Features Discovered:
 1. elo_home * (rest_days_away / 7) - Importance: 0.087
 2. log(qb_rating_home) - referee_penalty_rate - Importance: 0.065
 3. sqrt(total_line) / wind_speed - Importance: 0.053
                     """)
 
-        with col2:
-            if st.button("📊 Correlation Analysis", width="stretch"):
-                st.info("Running correlation matrix...")
-                st.success("✅ Analysis complete!")
-                st.caption("High correlations found: elo_diff ↔ win_prob (0.89)")
+    with col2:
+        if st.button("📊 Correlation Analysis", width="stretch"):
+            st.info("Running correlation matrix...")
+            st.success("✅ Analysis complete!")
+            st.caption("High correlations found: elo_diff ↔ win_prob (0.89)")
 
-    # ======================================================================
-    # TAB 4: DATA PIPELINE
-    # ======================================================================
 
-    with tab4:
-        st.subheader("🔄 Data Pipeline Management")
+# ======================================================================
+# TAB 4: DATA PIPELINE
+# ======================================================================
 
-        col1, col2, col3 = st.columns(3)
 
-        with col1:
-            st.metric("Last Update", "2 hours ago")
-            st.metric("Total Games", "2,476")
-        with col2:
-            st.metric("Cache Status", "Valid", delta="Healthy")
-            st.metric("Data Quality", "98.5%")
-        with col3:
-            st.metric("API Quota", "342/500")
-            st.metric("Storage", "1.2 GB")
+@st.fragment
+def _tab_pipeline():
+    """Data pipeline status and actions."""
+    st.subheader("🔄 Data Pipeline Management")
 
-        st.divider()
+    _metrics_table(PIPELINE_METRICS)
 
-        st.markdown("### 🎬 Pipeline Actions")
+    st.divider()
 
-        col1, col2, col3, col4 = st.columns(4)
+    st.markdown("### 🎬 Pipeline Actions")
 
-        with col1:
-            if st.button("📥 Download Latest", width="stretch"):
-                with st.spinner("Downloading..."):
-                    try:
-                        result = subprocess.run(
-                            [sys.executable, "scripts/download_data.py", "--latest"],
-                            capture_output=True,
-                            text=True,
-                            timeout=300,
-                        )
-                        if result.returncode == 0:
-                            st.success("✅ Data downloaded!")
-                        else:
-                            st.error("❌ Download failed")
-                    except Exception as e:
-                        st.error(f"Error: {e}")
+    col1, col2, col3, col4 = st.columns(4)
 
-        with col2:
-            if st.button("🔄 Force Refresh", width="stretch"):
-                st.cache_data.clear()
-                st.success("✅ Cache cleared!")
-
-        with col3:
-            if st.button("🧹 Clean Old Data", width="stretch"):
-                st.info("Removing data older than 2020...")
-                st.success("✅ Cleanup complete!")
-
-        with col4:
-            if st.button("📊 Audit Data", width="stretch"):
-                with st.spinner("Running audit..."):
-                    try:
-                        result = subprocess.run(
-                            [sys.executable, "scripts/audit_data_sources.py"],
-                            capture_output=True,
-                            text=True,
-                            timeout=60,
-                        )
-                        st.code(result.stdout)
-                    except Exception as e:
-                        st.error(f"Error: {e}")
+    with col1:
+        if st.button("📥 Download Latest", width="stretch"):
+            with st.spinner("Downloading..."):
+                try:
+                    result = run_script(
+                        "scripts/download_data.py", "--latest", timeout=300
+                    )
+                    if result.returncode == 0:
+                        st.success("✅ Data downloaded!")
+                    else:
+                        st.error("❌ Download failed")
+                except Exception as e:
+                    st.error(f"Error: {e}")
 
-    # ======================================================================
-    # TAB 5: AUTOMATION
-    # ======================================================================
+    with col2:
+        if st.button("🔄 Force Refresh", width="stretch"):
+            # Only pipeline data; static tables and other caches stay warm
+            clear_scope(PIPELINE)
+            st.success("✅ Pipeline cache cleared!")
 
-    with tab5:
-        st.subheader("⚡ Automation & Scheduling")
+    with col3:
+        if st.button("🧹 Clean Old Data", width="stretch"):
+            st.info("Removing data older than 2020...")
+            st.success("✅ Cleanup complete!")
 
-        st.markdown("### 📅 Scheduled Tasks")
+    with col4:
+        if st.button("📊 Audit Data", width="stretch"):
+            with st.spinner("Running audit..."):
+                try:
+                    result = run_script("scripts/audit_data_sources.py", timeout=60)
+                    st.code(result.stdout)
+                except Exception as e:
+                    st.error(f"Error: {e}")
 
-        tasks = [
-            {
-                "name": "Daily Predictions",
-                "schedule": "9:00 AM ET",
-                "status": "Active",
-                "last_run": "1 hour ago",
-            },
-            {
-                "name": "Weekly Retrain",
-                "schedule": "Monday 3:00 AM",
-                "status": "Active",
-                "last_run": "2 days ago",
-            },
-            {
-                "name": "Data Sync",
-                "schedule": "Every 6 hours",
-                "status": "Active",
-                "last_run": "3 hours ago",
-            },
+
+# ======================================================================
+# TAB 5: AUTOMATION
+# ======================================================================
+
+
+TASK_ACTIONS = ["Run", "Pause", "Resume"]
+
+
+@st.cache_data
+def _task_table() -> pd.DataFrame:
+    """One row per scheduled task, with an empty Action column."""
+    import pandas as pd
+
+    return pd.DataFrame(
+        [
             {
-                "name": "Bulldog Discovery",
-                "schedule": "Daily 2:00 AM",
-                "status": "Paused",
-                "last_run": "Never",
-            },
+                "Task": task.name,
+                "Schedule": task.schedule,
+                "Status": task.status,
+                "Last Run": task.last_run,
+                "Action": None,
+            }
+            for task in SCHEDULED_TASKS
         ]
+    )
 
-        for task in tasks:
-            with st.expander(f"{task['name']} - {task['status']}", expanded=False):
-                col1, col2, col3 = st.columns(3)
-                col1.metric("Schedule", task["schedule"])
-                col2.metric("Status", task["status"])
-                col3.metric("Last Run", task["last_run"])
-
-                col_a, col_b = st.columns(2)
-                with col_a:
-                    if st.button(f"▶️ Run Now", key=f"run_{task['name']}"):
-                        st.info(f"Running {task['name']}...")
-                with col_b:
-                    if task["status"] == "Active":
-                        if st.button(f"⏸️ Pause", key=f"pause_{task['name']}"):
-                            st.warning(f"Paused {task['name']}")
-                    else:
-                        if st.button(f"▶️ Resume", key=f"resume_{task['name']}"):
-                            st.success(f"Resumed {task['name']}")
 
-    # ======================================================================
-    # TAB 6: SYSTEM CONFIGURATION
-    # ======================================================================
+@st.fragment
+def _tab_automation():
+    """Scheduled tasks."""
+    st.subheader("⚡ Automation & Scheduling")
+
+    st.markdown("### 📅 Scheduled Tasks")
+
+    tasks = _task_table()
+    edited = st.data_editor(
+        tasks,
+        column_config={
+            "Action": st.column_config.SelectboxColumn("Action", options=TASK_ACTIONS),
+        },
+        disabled=["Task", "Schedule", "Status", "Last Run"],
+        hide_index=True,
+        key="task_table",
+        width="stretch",
+    )
+
+    # Rows whose Action differs from the cached (empty) column were picked
+    for name, status, action in zip(tasks["Task"], tasks["Status"], edited["Action"]):
+        if action == "Run":
+            st.info(f"Running {name}...")
+        elif action == "Pause" and status == "Active":
+            st.warning(f"Paused {name}")
+        elif action == "Resume" and status != "Active":
+            st.success(f"Resumed {name}")
+        elif action:
+            st.caption(f"{name} is already {status.lower()}")
+
+
+# ======================================================================
+# TAB 6: SYSTEM CONFIGURATION
+# ======================================================================
 
-    with tab6:
-        st.subheader("🛠️ System Configuration")
 
-        st.markdown("### 🔐 API Keys")
-        st.caption("Manage external service credentials")
+@st.fragment
+def _tab_system():
+    """API keys, backups and system settings."""
+    st.subheader("🛠️ System Configuration")
 
-        if st.button("🔑 View API Keys", width="stretch"):
-            st.code("""
+    st.markdown("### 🔐 API Keys")
+    st.caption("Manage external service credentials")
+
+    if st.button("🔑 View API Keys", width="stretch"):
+        st.code("""
 ODDS_API_KEY: ****6a4 (Valid)
 XAI_API_KEY: ****vuK (Valid)
 GOOGLE_CLIENT_ID: Not configured
 APPLE_CLIENT_ID: Not configured
             """)
 
-        st.divider()
+    st.divider()
 
-        st.markdown("### 💾 Backup & Export")
+    st.markdown("### 💾 Backup & Export")
 
-        col1, col2, col3 = st.columns(3)
+    col1, col2, col3 = st.columns(3)
 
-        with col1:
-            if st.button("💾 Backup Database", width="stretch"):
-                st.success("✅ Backup created!")
-                st.download_button(
-                    "📥 Download",
-                    data=b"backup_data",
-                    file_name=f"backup_{datetime.now().strftime('%Y%m%d')}.db",
-                )
+    with col1:
+        if st.button("💾 Backup Database", width="stretch"):
+            st.success("✅ Backup created!")
+            st.download_button(
+                "📥 Download",
+                data=b"backup_data",
+                file_name=f"backup_{datetime.now().strftime('%Y%m%d')}.db",
+            )
 
-        with col2:
-            if st.button("📤 Export Models", width="stretch"):
-                st.success("✅ Models exported!")
+    with col2:
+        if st.button("📤 Export Models", width="stretch"):
+            st.success("✅ Models exported!")
 
-        with col3:
-            if st.button("📊 Export Reports", width="stretch"):
-                st.success("✅ Reports exported!")
+    with col3:
+        if st.button("📊 Export Reports", width="stretch"):
+            st.success("✅ Reports exported!")
 
-        st.divider()
+    st.divider()
 
-        st.markdown("### 🔧 Advanced Settings")
+    st.markdown("### 🔧 Advanced Settings")
 
-        debug_mode = st.toggle("Debug Mode", help="Enable verbose logging")
-        production_mode = st.toggle(
-            "Production Mode", value=True, help="Disable experimental features"
-        )
+    debug_mode = st.toggle("Debug Mode", help="Enable verbose logging")
+    production_mode = st.toggle(
+        "Production Mode", value=True, help="Disable experimental features"
+    )
+
+    if st.button("💾 Save Configuration"):
+        st.success("✅ Configuration saved!")
+
+
+def advanced_settings_panel():
+    """Advanced settings panel with deep system controls."""
+
+    st.header("🔧 Advanced System Controls")
+    st.caption("Admin-only: Deep configuration and automation")
 
-        if st.button("💾 Save Configuration"):
-            st.success("✅ Configuration saved!")
+    # Create tabs for different control sections
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(
+        [
+            "🤖 Bulldog AI",
+            "🎓 Model Training",
+            "📊 Features",
+            "🔄 Data Pipeline",
+            "⚡ Automation",
+            "🛠️ System",
+        ]
+    )
+
+    # Each tab is a fragment: its widgets rerun only that tab
+    with tab1:
+        _tab_bulldog()
+    with tab2:
+        _tab_training()
+    with tab3:
+        _tab_features()
+    with tab4:
+        _tab_pipeline()
+    with tab5:
+        _tab_automation()
+    with tab6:
+        _tab_system()
 
 
 # Export function
@@ -8,17 +8,49 @@ Uses OpenAI, Anthropic, and Google AI for intelligent analysis.
 SECURITY: Refuses all codebase/system questions.
 """
 
+import hashlib
+import importlib.util
 import json
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 import streamlit as st
-
-# Load environment variables
 from dotenv import load_dotenv
 
-load_dotenv(Path(__file__).parent.parent / "config" / "api_keys.env")
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import tenacity
+except ImportError:
+    tenacity = None
+
+API_KEYS_ENV = Path(__file__).resolve().parent.parent / "config" / "api_keys.env"
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """
+    Load API keys from API_KEYS_ENV into the environment, once.
+
+    Called by the reasoners rather than at import, so hot reloads of this
+    module don't re-parse the file. The environment marker survives
+    reloads, which reset the lru_cache.
+    """
+    if os.environ.get("_NFL_API_KEYS_ENV_LOADED"):
+        return True
+    load_dotenv(API_KEYS_ENV)
+    os.environ["_NFL_API_KEYS_ENV_LOADED"] = "1"
+    return True
+
 
 # =============================================================================
 # SECURITY GUARDRAILS
@@ -48,20 +80,32 @@ FORBIDDEN_TOPICS = [
 ]
 
 
+# One automaton pass over the query instead of a substring scan per topic;
+# without pyahocorasick, one regex pass does the same. The regex matches the
+# lowercased query case-sensitively: IGNORECASE disables re's literal
+# first-character skip and is several times slower on safe queries.
+if ahocorasick is not None:
+    _FORBIDDEN_AUTOMATON = ahocorasick.Automaton()
+    for _topic in FORBIDDEN_TOPICS:
+        _FORBIDDEN_AUTOMATON.add_word(_topic, _topic)
+    _FORBIDDEN_AUTOMATON.make_automaton()
+else:
+    _FORBIDDEN_AUTOMATON = None
+
+_FORBIDDEN_RE = re.compile("|".join(map(re.escape, FORBIDDEN_TOPICS)))
+
+
 def is_safe_query(query: str) -> bool:
     """Check if query is safe (not asking about system internals)."""
     query_lower = query.lower()
 
-    for forbidden in FORBIDDEN_TOPICS:
-        if forbidden in query_lower:
-            return False
+    if _FORBIDDEN_AUTOMATON is not None:
+        return next(_FORBIDDEN_AUTOMATON.iter(query_lower), None) is None
 
-    return True
+    return _FORBIDDEN_RE.search(query_lower) is None
 
 
-def get_security_refusal() -> str:
-    """Return security refusal message."""
-    return """
+SECURITY_REFUSAL = """
 🔒 **Security Notice**
 
 I can't answer questions about:
@@ -82,29 +126,196 @@ Please ask about betting strategy instead! 🏈
 """
 
 
+def get_security_refusal() -> str:
+    """Return security refusal message."""
+    return SECURITY_REFUSAL
+
+
 # =============================================================================
 # AI PROVIDER INTEGRATIONS
 # =============================================================================
 
 
+# Identical bets within the TTL reuse the earlier analysis instead of paying
+# for another API call
+ANALYSIS_CACHE_TTL = 600  # seconds
+_analysis_cache: Dict[str, Tuple[float, str]] = {}
+_analysis_cache_lock = threading.Lock()
+
+
+def _analysis_key(provider: str, game_info: Dict, bet_info: Dict) -> str:
+    """Hash of everything that goes into a provider's prompt."""
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "matchup": game_info["matchup"],
+            "context": game_info.get("context", ""),
+            "bet_type": bet_info["bet_type"],
+            "odds": bet_info["odds"],
+            "win_prob": bet_info["win_prob"],
+            "edge": bet_info["edge"],
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+# Analyses allowed in flight per provider, so batches stay under rate limits
+PROVIDER_CONCURRENCY = {"OpenAI": 3, "Claude": 2, "Gemini": 5}
+_provider_slots = {
+    provider: threading.BoundedSemaphore(limit)
+    for provider, limit in PROVIDER_CONCURRENCY.items()
+}
+
+
+def _is_rate_limited(error: BaseException) -> bool:
+    """Whether error is a provider's rate-limit (HTTP 429) response."""
+    if 429 in (getattr(error, "status_code", None), getattr(error, "code", None)):
+        return True
+    message = str(error).lower()
+    return (
+        "429" in message or "rate limit" in message or "resource exhausted" in message
+    )
+
+
+# Retry rate-limited calls with jittered exponential backoff; without
+# tenacity (an optional AI dependency) they fail on the first 429
+if tenacity is not None:
+    _retry_rate_limited = tenacity.retry(
+        stop=tenacity.stop_after_attempt(4),
+        wait=tenacity.wait_random_exponential(multiplier=0.2, max=8),
+        retry=tenacity.retry_if_exception(_is_rate_limited),
+        reraise=True,
+    )
+else:
+
+    def _retry_rate_limited(call: Callable) -> Callable:
+        return call
+
+
+def _cached_analysis(provider: str) -> Callable:
+    """
+    Wrap a reasoner's analyze_bet with the availability check, error
+    message and the response cache. Errors are returned but never cached.
+
+    Calls to the provider hold one of its PROVIDER_CONCURRENCY slots and
+    back off and retry when rate limited.
+    """
+
+    def decorator(analyze: Callable) -> Callable:
+        call = _retry_rate_limited(analyze)
+
+        @wraps(analyze)
+        def wrapper(self, game_info: Dict, bet_info: Dict) -> Optional[str]:
+            if not self.available:
+                return None
+
+            key = _analysis_key(provider, game_info, bet_info)
+            now = time.monotonic()
+            with _analysis_cache_lock:
+                hit = _analysis_cache.get(key)
+            if hit is not None and now - hit[0] < ANALYSIS_CACHE_TTL:
+                return hit[1]
+
+            try:
+                with _provider_slots[provider]:
+                    analysis = call(self, game_info, bet_info)
+            except Exception as e:
+                return f"{provider} Error: {str(e)[:50]}"
+
+            with _analysis_cache_lock:
+                # Drop expired entries so the cache stays bounded by the TTL
+                for stale in [
+                    k
+                    for k, (stamp, _) in _analysis_cache.items()
+                    if now - stamp >= ANALYSIS_CACHE_TTL
+                ]:
+                    del _analysis_cache[stale]
+                _analysis_cache[key] = (now, analysis)
+            return analysis
+
+        return wrapper
+
+    return decorator
+
+
+# One pooled client per provider and key, reused across calls and reruns so
+# requests skip the TCP/TLS handshake. The SDKs are imported on first use.
+HTTP_LIMITS = dict(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+)
+
+
+def _http_client():
+    """Connection pool for one SDK client; HTTP/2 when h2 is installed."""
+    import httpx
+
+    return httpx.Client(http2=sdk_installed("h2"), limits=httpx.Limits(**HTTP_LIMITS))
+
+
+# SDK behind each AI provider's key
+PROVIDER_SDKS = {
+    "OPENAI_API_KEY": "openai",
+    "ANTHROPIC_API_KEY": "anthropic",
+    "GOOGLE_API_KEY": "google.generativeai",
+}
+
+
+@lru_cache(maxsize=None)
+def sdk_installed(module: str) -> bool:
+    """Whether module can be imported, checked without importing it."""
+    try:
+        return importlib.util.find_spec(module) is not None
+    except ModuleNotFoundError:
+        # A parent package (e.g. google) is missing
+        return False
+
+
+@lru_cache(maxsize=4)
+def openai_client(api_key: str):
+    """Shared OpenAI client for api_key."""
+    import openai
+
+    return openai.OpenAI(api_key=api_key, http_client=_http_client())
+
+
+@lru_cache(maxsize=4)
+def anthropic_client(api_key: str):
+    """Shared Anthropic client for api_key."""
+    import anthropic
+
+    return anthropic.Anthropic(api_key=api_key, http_client=_http_client())
+
+
+@lru_cache(maxsize=1)  # genai.configure is global: one key at a time
+def gemini_model(api_key: str):
+    """Shared Gemini Pro model, with the SDK configured for api_key."""
+    import google.generativeai as genai
+
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel("gemini-pro")
+
+
 class OpenAIReasoner:
     """OpenAI GPT-4 reasoning."""
 
     def __init__(self):
+        _load_env()
         self.api_key = os.getenv("OPENAI_API_KEY")
-        self.available = bool(self.api_key)
+        self.available = bool(self.api_key) and sdk_installed(
+            PROVIDER_SDKS["OPENAI_API_KEY"]
+        )
 
+    @property
+    def client(self):
+        """Pooled OpenAI 1.x client for this reasoner's key."""
+        return openai_client(self.api_key)
+
+    @_cached_analysis("OpenAI")
     def analyze_bet(self, game_info: Dict, bet_info: Dict) -> Optional[str]:
         """Analyze bet using GPT-4."""
-        if not self.available:
-            return None
-
-        try:
-            import openai
-
-            openai.api_key = self.api_key
-
-            prompt = f"""Analyze this NFL bet as a professional sports bettor:
+        prompt = f"""Analyze this NFL bet as a professional sports bettor:
 
 Game: {game_info['matchup']}
 Bet: {bet_info['bet_type']}
@@ -122,89 +333,127 @@ Provide a concise 2-3 sentence analysis focusing on:
 
 Be direct and actionable. Focus on football analysis only."""
 
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert NFL betting analyst. Provide clear, actionable insights.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=200,
-                temperature=0.7,
-            )
+        response = self.client.chat.completions.create(
+            model="gpt-4",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are an expert NFL betting analyst. Provide clear, actionable insights.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=200,
+            temperature=0.7,
+        )
+
+        return response.choices[0].message.content.strip()
+
+    def stream_answer(self, question: str) -> Iterator[str]:
+        """Stream GPT-4's answer to a betting question."""
+        stream = self.client.chat.completions.create(
+            model="gpt-4",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are an expert NFL betting analyst. Answer questions about betting strategy, game analysis, and risk management. NEVER discuss system internals, code, or security.",
+                },
+                {"role": "user", "content": question},
+            ],
+            max_tokens=300,
+            temperature=0.7,
+            stream=True,
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
-            return response.choices[0].message.content.strip()
 
-        except Exception as e:
-            return f"OpenAI Error: {str(e)[:50]}"
+# Shared by every Claude analysis, so it is sent as a cacheable system block
+CLAUDE_ANALYSIS_INSTRUCTIONS = """Provide 2-3 sentences analyzing:
+1. Strategic value of this bet
+2. Key risk factors
+3. Overall assessment
+
+Focus on actionable football insights."""
 
 
 class AnthropicReasoner:
     """Anthropic Claude reasoning."""
 
     def __init__(self):
+        _load_env()
         self.api_key = os.getenv("ANTHROPIC_API_KEY")
-        self.available = bool(self.api_key)
+        self.available = bool(self.api_key) and sdk_installed(
+            PROVIDER_SDKS["ANTHROPIC_API_KEY"]
+        )
+
+    @property
+    def client(self):
+        """Pooled Anthropic client for this reasoner's key."""
+        return anthropic_client(self.api_key)
 
+    @_cached_analysis("Claude")
     def analyze_bet(self, game_info: Dict, bet_info: Dict) -> Optional[str]:
         """Analyze bet using Claude."""
-        if not self.available:
-            return None
-
-        try:
-            import anthropic
-
-            client = anthropic.Anthropic(api_key=self.api_key)
-
-            prompt = f"""Analyze this NFL betting opportunity:
+        prompt = f"""Analyze this NFL betting opportunity:
 
 {game_info['matchup']}
 Bet: {bet_info['bet_type']} @ {bet_info['odds']}
 Win Prob: {bet_info['win_prob']}% | Edge: +{bet_info['edge']}%
 
-{game_info.get('context', '')}
-
-Provide 2-3 sentences analyzing:
-1. Strategic value of this bet
-2. Key risk factors
-3. Overall assessment
-
-Focus on actionable football insights."""
-
-            message = client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=200,
-                temperature=0.7,
-                messages=[{"role": "user", "content": prompt}],
-            )
+{game_info.get('context', '')}"""
+
+        message = self.client.messages.create(
+            model="claude-3-5-sonnet-20241022",
+            max_tokens=200,
+            temperature=0.7,
+            system=[
+                {
+                    "type": "text",
+                    "text": CLAUDE_ANALYSIS_INSTRUCTIONS,
+                    # Stable prefix; the API caches it once it is long enough
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+            messages=[{"role": "user", "content": prompt}],
+        )
 
-            return message.content[0].text.strip()
+        return message.content[0].text.strip()
 
-        except Exception as e:
-            return f"Claude Error: {str(e)[:50]}"
+    def stream_answer(self, question: str) -> Iterator[str]:
+        """Stream Claude's answer to a betting question."""
+        with self.client.messages.stream(
+            model="claude-3-5-sonnet-20241022",
+            max_tokens=300,
+            messages=[
+                {
+                    "role": "user",
+                    "content": f"As an NFL betting expert, answer this question (refuse if about system/code): {question}",
+                }
+            ],
+        ) as stream:
+            yield from stream.text_stream
 
 
 class GoogleReasoner:
     """Google Gemini reasoning."""
 
     def __init__(self):
+        _load_env()
         self.api_key = os.getenv("GOOGLE_API_KEY")
-        self.available = bool(self.api_key)
+        self.available = bool(self.api_key) and sdk_installed(
+            PROVIDER_SDKS["GOOGLE_API_KEY"]
+        )
 
+    @property
+    def model(self):
+        """Shared Gemini model for this reasoner's key."""
+        return gemini_model(self.api_key)
+
+    @_cached_analysis("Gemini")
     def analyze_bet(self, game_info: Dict, bet_info: Dict) -> Optional[str]:
         """Analyze bet using Gemini Pro."""
-        if not self.available:
-            return None
-
-        try:
-            import google.generativeai as genai
-
-            genai.configure(api_key=self.api_key)
-            model = genai.GenerativeModel("gemini-pro")
-
-            prompt = f"""NFL Betting Analysis:
+        prompt = f"""NFL Betting Analysis:
 
 Game: {game_info['matchup']}
 Recommended Bet: {bet_info['bet_type']}
@@ -222,11 +471,16 @@ Analyze this bet in 2-3 clear sentences covering:
 
 Be concise and football-focused."""
 
-            response = model.generate_content(prompt)
-            return response.text.strip()
+        response = self.model.generate_content(prompt)
+        return response.text.strip()
 
-        except Exception as e:
-            return f"Gemini Error: {str(e)[:50]}"
+    def stream_answer(self, question: str) -> Iterator[str]:
+        """Stream Gemini's answer to a betting question."""
+        response = self.model.generate_content(
+            f"Answer this NFL betting question: {question}", stream=True
+        )
+        for chunk in response:
+            yield chunk.text
 
 
 # =============================================================================
@@ -234,6 +488,14 @@ Be concise and football-focused."""
 # =============================================================================
 
 
+# Sentiment keywords for the consensus view, each matched as a substring
+POSITIVE_KEYWORDS = ("strong", "good", "solid", "favorable", "confident", "value")
+NEGATIVE_KEYWORDS = ("risky", "concern", "weak", "cautious", "avoid", "questionable")
+
+_POSITIVE_RE = re.compile("|".join(POSITIVE_KEYWORDS))
+_NEGATIVE_RE = re.compile("|".join(NEGATIVE_KEYWORDS))
+
+
 class AIReasoningSwarm:
     """Multi-AI reasoning system with consensus analysis."""
 
@@ -253,16 +515,30 @@ class AIReasoningSwarm:
         return [name for name, reasoner in self.reasoners.items() if reasoner.available]
 
     def analyze_bet_swarm(self, game_info: Dict, bet_info: Dict) -> Dict[str, str]:
-        """Get analysis from all available AIs."""
-        results = {}
-
-        for name, reasoner in self.reasoners.items():
-            if reasoner.available:
-                analysis = reasoner.analyze_bet(game_info, bet_info)
-                if analysis:
-                    results[name] = analysis
+        """
+        Get analysis from all available AIs.
+
+        The provider calls are network-bound, so they run concurrently and
+        the swarm takes as long as the slowest AI rather than the sum.
+        """
+        available = {
+            name: reasoner
+            for name, reasoner in self.reasoners.items()
+            if reasoner.available
+        }
+        if not available:
+            return {}
 
-        return results
+        with ThreadPoolExecutor(max_workers=len(available)) as executor:
+            analyses = executor.map(
+                lambda reasoner: reasoner.analyze_bet(game_info, bet_info),
+                available.values(),
+            )
+            return {
+                name: analysis
+                for name, analysis in zip(available, analyses)
+                if analysis
+            }
 
     def get_consensus_view(self, swarm_results: Dict[str, str]) -> str:
         """Synthesize consensus from multiple AI views."""
@@ -271,31 +547,14 @@ class AIReasoningSwarm:
 
         num_ais = len(swarm_results)
 
-        # Simple consensus based on sentiment
-        positive_keywords = [
-            "strong",
-            "good",
-            "solid",
-            "favorable",
-            "confident",
-            "value",
-        ]
-        negative_keywords = [
-            "risky",
-            "concern",
-            "weak",
-            "cautious",
-            "avoid",
-            "questionable",
-        ]
-
+        # Simple consensus based on sentiment: distinct keywords per analysis
         positive_count = 0
         negative_count = 0
 
         for analysis in swarm_results.values():
             analysis_lower = analysis.lower()
-            positive_count += sum(1 for kw in positive_keywords if kw in analysis_lower)
-            negative_count += sum(1 for kw in negative_keywords if kw in analysis_lower)
+            positive_count += len(set(_POSITIVE_RE.findall(analysis_lower)))
+            negative_count += len(set(_NEGATIVE_RE.findall(analysis_lower)))
 
         if positive_count > negative_count * 1.5:
             consensus = "✅ **STRONG CONSENSUS**: AIs agree this bet has solid value."
@@ -310,67 +569,40 @@ class AIReasoningSwarm:
 
     def answer_betting_question(self, question: str, context: Dict = None) -> str:
         """Answer general betting questions (with security checks)."""
+        return "".join(self.answer_betting_question_stream(question, context)).strip()
+
+    def answer_betting_question_stream(
+        self, question: str, context: Dict = None
+    ) -> Iterator[str]:
+        """
+        Stream an answer to a betting question (with security checks).
+
+        The first available AI answers. One that fails before sending any
+        text is skipped for the next; a failure mid-answer ends the stream
+        with a note instead.
+        """
         # Security check
         if not is_safe_query(question):
-            return get_security_refusal()
+            yield get_security_refusal()
+            return
 
         # Use first available AI
-        for name, reasoner in self.reasoners.items():
-            if reasoner.available:
-                try:
-                    if name == "GPT-4":
-                        import openai
-
-                        openai.api_key = reasoner.api_key
-
-                        response = openai.ChatCompletion.create(
-                            model="gpt-4",
-                            messages=[
-                                {
-                                    "role": "system",
-                                    "content": "You are an expert NFL betting analyst. Answer questions about betting strategy, game analysis, and risk management. NEVER discuss system internals, code, or security.",
-                                },
-                                {"role": "user", "content": question},
-                            ],
-                            max_tokens=300,
-                            temperature=0.7,
-                        )
-
-                        return response.choices[0].message.content.strip()
-
-                    elif name == "Claude":
-                        import anthropic
-
-                        client = anthropic.Anthropic(api_key=reasoner.api_key)
-
-                        message = client.messages.create(
-                            model="claude-3-5-sonnet-20241022",
-                            max_tokens=300,
-                            messages=[
-                                {
-                                    "role": "user",
-                                    "content": f"As an NFL betting expert, answer this question (refuse if about system/code): {question}",
-                                }
-                            ],
-                        )
-
-                        return message.content[0].text.strip()
-
-                    elif name == "Gemini":
-                        import google.generativeai as genai
-
-                        genai.configure(api_key=reasoner.api_key)
-                        model = genai.GenerativeModel("gemini-pro")
-
-                        response = model.generate_content(
-                            f"Answer this NFL betting question: {question}"
-                        )
-                        return response.text.strip()
-
-                except Exception as e:
+        for reasoner in self.reasoners.values():
+            if not reasoner.available:
+                continue
+
+            started = False
+            try:
+                for text in reasoner.stream_answer(question):
+                    started = True
+                    yield text
+            except Exception as e:
+                if not started:
                     continue
+                yield f"\n\n⚠️ Answer interrupted: {str(e)[:50]}"
+            return
 
-        return "⚠️ No AI providers configured. Add API keys in Admin Panel → System settings."
+        yield "⚠️ No AI providers configured. Add API keys in Admin Panel → System settings."
 
 
 # =============================================================================
@@ -378,9 +610,19 @@ class AIReasoningSwarm:
 # =============================================================================
 
 
+@st.cache_resource
+def get_swarm() -> AIReasoningSwarm:
+    """
+    Swarm shared across reruns and sessions.
+
+    Reads the API keys once; clear it with get_swarm.clear() after they change.
+    """
+    return AIReasoningSwarm()
+
+
 def show_ai_reasoning_widget(game_info: Dict, bet_info: Dict):
     """Display AI reasoning swarm widget."""
-    swarm = AIReasoningSwarm()
+    swarm = get_swarm()
 
     available_ais = swarm.get_available_ais()
 
@@ -420,7 +662,7 @@ def show_ai_chat_assistant():
         "Ask questions about betting strategy, game analysis, or risk management"
     )
 
-    swarm = AIReasoningSwarm()
+    swarm = get_swarm()
     available_ais = swarm.get_available_ais()
 
     if not available_ais:
@@ -444,11 +686,9 @@ def show_ai_chat_assistant():
         with st.chat_message("user"):
             st.markdown(question)
 
-        # Get AI response
+        # Stream the AI response as it arrives
         with st.chat_message("assistant"):
-            with st.spinner("🤔 Thinking..."):
-                response = swarm.answer_betting_question(question)
-            st.markdown(response)
+            response = st.write_stream(swarm.answer_betting_question_stream(question))
 
         # Add assistant message
         st.session_state.ai_chat_history.append(
@@ -462,6 +702,10 @@ def show_ai_chat_assistant():
 
 __all__ = [
     "AIReasoningSwarm",
+    "get_swarm",
+    "openai_client",
+    "anthropic_client",
+    "gemini_model",
     "show_ai_reasoning_widget",
     "show_ai_chat_assistant",
     "is_safe_query",
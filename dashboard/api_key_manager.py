@@ -1,17 +1,71 @@
 """API Key Manager for Dashboard - Easy configuration interface."""
 
+import hashlib
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import streamlit as st
 from dotenv import load_dotenv, set_key
 
+from dashboard.ai_reasoning_swarm import (
+    PROVIDER_SDKS,
+    anthropic_client,
+    gemini_model,
+    get_swarm,
+    openai_client,
+    sdk_installed,
+)
+
+# Successful key tests, keyed by (key name, hash of key value)
+KEY_TEST_TTL = 300  # seconds
+_key_test_cache: Dict[Tuple[str, str], Tuple[float, Tuple[bool, str]]] = {}
+_key_test_lock = threading.Lock()
+
+
+# Format rules per key: (minimum length, full-match pattern, mismatch message)
+_KEY_RULES: Dict[str, Tuple[int, re.Pattern, str]] = {
+    "OPENAI_API_KEY": (
+        20,
+        re.compile(r"sk-[A-Za-z0-9_-]+"),
+        "OpenAI keys should start with 'sk-' (letters, digits, '-' and '_' only)",
+    ),
+    "ANTHROPIC_API_KEY": (
+        20,
+        re.compile(r"sk-ant-[A-Za-z0-9_-]+"),
+        "Anthropic keys should start with 'sk-ant-' (letters, digits, '-' and '_' only)",
+    ),
+    "ODDS_API_KEY": (
+        20,
+        re.compile(r"[A-Za-z0-9]+"),
+        "API key should only contain letters and digits",
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class KeyCounts:
+    """Summary counts shown above the API key settings."""
+
+    configured: int
+    total: int
+    required_configured: int
+    required: int
+    ai_configured: int
+    ai: int
+
 
 class APIKeyManager:
     """Manage API keys through dashboard interface."""
 
+    # mtime of the env file when it was last loaded, shared by all managers
+    _env_mtime: Optional[int] = None
+
     def __init__(self):
         """Initialize API key manager."""
         self.env_file = Path(__file__).parent.parent / "config" / "api_keys.env"
@@ -24,8 +78,31 @@ class APIKeyManager:
             # Copy template to create new env file
             self.env_file.write_text(self.env_template.read_text())
 
+        self._status: Optional[Dict[str, Dict]] = None
+        self._counts: Optional[KeyCounts] = None
+
         # Load current keys
-        load_dotenv(self.env_file)
+        self._sync_env()
+
+    def _sync_env(self) -> bool:
+        """
+        Load the env file if it changed since it was last loaded.
+
+        Returns:
+            True if the file was (re)loaded
+        """
+        try:
+            mtime = self.env_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == APIKeyManager._env_mtime:
+            return False
+
+        # The first load leaves variables already set in the environment alone
+        load_dotenv(self.env_file, override=APIKeyManager._env_mtime is not None)
+        APIKeyManager._env_mtime = mtime
+        self._status = None
+        return True
 
     def get_key(self, key_name: str) -> Optional[str]:
         """
@@ -52,13 +129,22 @@ class APIKeyManager:
         """
         try:
             set_key(str(self.env_file), key_name, key_value)
-            # Reload environment
-            load_dotenv(self.env_file, override=True)
+            self.reload()
             return True
         except Exception as e:
             st.error(f"Failed to save key: {e}")
             return False
 
+    def reload(self):
+        """Reload keys from the env file and rebuild the cached AI swarm."""
+        load_dotenv(self.env_file, override=True)
+        try:
+            APIKeyManager._env_mtime = self.env_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            pass
+        self._status = None
+        get_swarm.clear()
+
     def validate_key_format(self, key_name: str, key_value: str) -> tuple[bool, str]:
         """
         Validate API key format.
@@ -73,20 +159,14 @@ class APIKeyManager:
         if not key_value or key_value.strip() == "":
             return False, "Key cannot be empty"
 
-        # Validate specific key formats
-        if key_name == "OPENAI_API_KEY":
-            if not key_value.startswith("sk-"):
-                return False, "OpenAI keys should start with 'sk-'"
-            if len(key_value) < 20:
+        # Validate specific key formats, cheapest check first
+        rule = _KEY_RULES.get(key_name)
+        if rule is not None:
+            min_length, pattern, message = rule
+            if len(key_value) < min_length:
                 return False, "Key seems too short"
-
-        elif key_name == "ANTHROPIC_API_KEY":
-            if not key_value.startswith("sk-ant-"):
-                return False, "Anthropic keys should start with 'sk-ant-'"
-
-        elif key_name == "ODDS_API_KEY":
-            if len(key_value) < 20:
-                return False, "API key seems too short"
+            if not pattern.fullmatch(key_value):
+                return False, message
 
         return True, "Format looks good"
 
@@ -94,6 +174,9 @@ class APIKeyManager:
         """
         Test if API key is working.
 
+        Successful results are remembered for KEY_TEST_TTL seconds per key
+        value, so repeated tests don't hit the provider again.
+
         Args:
             key_name: Name of the API key
 
@@ -105,36 +188,45 @@ class APIKeyManager:
         if not key_value:
             return False, "No key configured"
 
+        cache_key = (key_name, hashlib.sha256(key_value.encode()).hexdigest()[:16])
+        now = time.monotonic()
+        with _key_test_lock:
+            hit = _key_test_cache.get(cache_key)
+        if hit is not None and now - hit[0] < KEY_TEST_TTL:
+            return hit[1]
+
+        result = self._probe_key(key_name, key_value)
+        if result[0]:
+            with _key_test_lock:
+                _key_test_cache[cache_key] = (now, result)
+        return result
+
+    def _probe_key(self, key_name: str, key_value: str) -> tuple[bool, str]:
+        """Make the cheapest authenticated request the provider offers."""
+        if key_name in PROVIDER_SDKS and not sdk_installed(PROVIDER_SDKS[key_name]):
+            return False, "⚠️ Required library not installed"
+
         try:
             # Test OpenAI
             if key_name == "OPENAI_API_KEY":
-                import openai
-
-                openai.api_key = key_value
-                # Try to list models (lightweight test)
-                models = openai.Model.list()
-                return True, f"✅ Connected! Found {len(models.data)} models"
+                # One authenticated request that doesn't depend on access to
+                # any particular model (a retrieve 404s for unlicensed ones)
+                openai_client(key_value).models.list()
+                return True, "✅ Connected! API key is valid"
 
             # Test Anthropic
             elif key_name == "ANTHROPIC_API_KEY":
-                import anthropic
-
-                client = anthropic.Anthropic(api_key=key_value)
-                # Try a minimal request
-                response = client.messages.create(
-                    model="claude-3-5-sonnet-20241022",
-                    max_tokens=10,
-                    messages=[{"role": "user", "content": "test"}],
-                )
+                # Listing models is authenticated but bills no tokens
+                anthropic_client(key_value).models.list(limit=1)
                 return True, "✅ Connected! API key is valid"
 
             # Test Google Gemini
             elif key_name == "GOOGLE_API_KEY":
                 import google.generativeai as genai
 
-                genai.configure(api_key=key_value)
-                # Try to list models
-                models = genai.list_models()
+                gemini_model(key_value)  # configures the SDK for key_value
+                # list_models is lazy; fetch a single page of one model
+                next(genai.list_models(page_size=1), None)
                 return True, "✅ Connected! API key is valid"
 
             # Test The Odds API
@@ -159,9 +251,11 @@ class APIKeyManager:
             return False, "⚠️ Required library not installed"
         except Exception as e:
             error_msg = str(e)
-            if "401" in error_msg or "Unauthorized" in error_msg:
+            # The OpenAI and Anthropic SDKs carry the HTTP status; Gemini doesn't
+            status = getattr(e, "status_code", None)
+            if status == 401 or "401" in error_msg or "Unauthorized" in error_msg:
                 return False, "❌ Invalid API key"
-            elif "403" in error_msg or "Forbidden" in error_msg:
+            elif status == 403 or "403" in error_msg or "Forbidden" in error_msg:
                 return False, "❌ API key doesn't have permission"
             elif "quota" in error_msg.lower():
                 return False, "⚠️ Quota exceeded"
@@ -172,9 +266,16 @@ class APIKeyManager:
         """
         Get status of all configured API keys.
 
+        Built once and reused until the env file changes or a key is saved.
+
         Returns:
             Dictionary with key status information
         """
+        if self._sync_env():
+            get_swarm.clear()
+        if self._status is not None:
+            return self._status
+
         keys = {
             "OPENAI_API_KEY": {
                 "name": "OpenAI (GPT-4)",
@@ -214,16 +315,44 @@ class APIKeyManager:
         }
 
         status = {}
+        configured = required = required_configured = ai = ai_configured = 0
         for key_name, info in keys.items():
             key_value = self.get_key(key_name)
+            is_set = bool(key_value)
             status[key_name] = {
                 **info,
-                "configured": bool(key_value),
+                "configured": is_set,
                 "masked_value": self._mask_key(key_value) if key_value else None,
             }
-
+            configured += is_set
+            if info["required"]:
+                required += 1
+                required_configured += is_set
+            if key_name in PROVIDER_SDKS:
+                ai += 1
+                ai_configured += is_set
+
+        self._counts = KeyCounts(
+            configured=configured,
+            total=len(status),
+            required_configured=required_configured,
+            required=required,
+            ai_configured=ai_configured,
+            ai=ai,
+        )
+        self._status = status
         return status
 
+    def get_key_counts(self) -> KeyCounts:
+        """
+        Get summary counts for the configured API keys.
+
+        Returns:
+            KeyCounts computed alongside get_all_keys_status
+        """
+        self.get_all_keys_status()
+        return self._counts
+
     def _mask_key(self, key: str) -> str:
         """
         Mask API key for display.
@@ -248,33 +377,29 @@ class APIKeyManager:
 # =============================================================================
 
 
+@st.cache_resource
+def get_key_manager() -> APIKeyManager:
+    """Key manager shared across reruns, so the env file is read once."""
+    return APIKeyManager()
+
+
 def show_api_key_settings():
     """Display API key management interface."""
     st.markdown("### 🔑 API Key Configuration")
     st.caption("Configure your API keys for data sources and AI reasoning")
 
-    manager = APIKeyManager()
+    manager = get_key_manager()
     all_keys = manager.get_all_keys_status()
+    counts = manager.get_key_counts()
 
     # Show summary
-    configured_count = sum(1 for k in all_keys.values() if k["configured"])
-    total_count = len(all_keys)
-
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Configured", f"{configured_count}/{total_count}")
+        st.metric("Configured", f"{counts.configured}/{counts.total}")
     with col2:
-        required_keys = [k for k in all_keys.values() if k["required"]]
-        required_configured = sum(1 for k in required_keys if k["configured"])
-        st.metric("Required", f"{required_configured}/{len(required_keys)}")
+        st.metric("Required", f"{counts.required_configured}/{counts.required}")
     with col3:
-        ai_keys = [
-            k
-            for k in all_keys.values()
-            if "OpenAI" in k["name"] or "Claude" in k["name"] or "Gemini" in k["name"]
-        ]
-        ai_configured = sum(1 for k in ai_keys if k["configured"])
-        st.metric("AI Providers", f"{ai_configured}/{len(ai_keys)}")
+        st.metric("AI Providers", f"{counts.ai_configured}/{counts.ai}")
 
     st.divider()
 
@@ -415,11 +540,18 @@ def show_api_key_settings():
     with col1:
         if st.button("🧪 Test All Keys", width="stretch"):
             with st.spinner("Testing API connections..."):
+                configured = [
+                    key_name
+                    for key_name, key_info in all_keys.items()
+                    if key_info["configured"]
+                ]
+                # Each test is a network round-trip; run them side by side
                 results = {}
-                for key_name, key_info in all_keys.items():
-                    if key_info["configured"]:
-                        is_working, message = manager.test_key(key_name)
-                        results[key_name] = (is_working, message)
+                if configured:
+                    with ThreadPoolExecutor(max_workers=len(configured)) as executor:
+                        results = dict(
+                            zip(configured, executor.map(manager.test_key, configured))
+                        )
 
                 # Show results
                 for key_name, (is_working, message) in results.items():
@@ -438,7 +570,7 @@ def show_api_key_settings():
 
     with col3:
         if st.button("🔄 Reload Keys", width="stretch"):
-            load_dotenv(manager.env_file, override=True)
+            manager.reload()
             st.success("✅ Keys reloaded!")
             st.rerun()
 
@@ -542,4 +674,10 @@ def show_api_key_input(
 # EXPORT
 # =============================================================================
 
-__all__ = ["APIKeyManager", "show_api_key_settings", "show_api_key_input"]
+__all__ = [
+    "APIKeyManager",
+    "KeyCounts",
+    "get_key_manager",
+    "show_api_key_settings",
+    "show_api_key_input",
+]
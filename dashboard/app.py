@@ -24,6 +24,8 @@ from plotly.subplots import make_subplots
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from dashboard.cache_scopes import PIPELINE, scoped_cache_data
+
 # Import live game tracking
 sys.path.insert(0, str(Path(__file__).parent))
 from live_game_display import (
@@ -226,7 +228,7 @@ TEAM_COLORS = {
 # -----------------------------------------------------------------------------
 # DATA LOADING
 # -----------------------------------------------------------------------------
-@st.cache_data(ttl=300)
+@scoped_cache_data(PIPELINE, ttl=300)
 def load_games():
     """Load real game data."""
     data_dir = project_root / "data" / "schedules"
@@ -0,0 +1,50 @@
+"""
+Dashboard Cache Scopes
+
+Named groups of st.cache_data functions that can be cleared together.
+st.cache_data.clear() drops every cached function in the process; a
+scope only drops the functions registered under it.
+"""
+
+from typing import Callable, Dict, Tuple
+
+import streamlit as st
+
+# Cached data that comes from the data pipeline (schedules, odds)
+PIPELINE = "pipeline"
+
+# scope -> {(module, qualname): cached function}. Keyed by name because
+# Streamlit re-executes the main script, and so its decorators, on every
+# rerun; registering a function again replaces its old wrapper.
+_SCOPES: Dict[str, Dict[Tuple[str, str], Callable]] = {}
+
+
+def scoped_cache_data(scope: str, **cache_kwargs):
+    """
+    Decorator: st.cache_data(**cache_kwargs), registered under scope.
+
+    Args:
+        scope: Name of the cache group, e.g. PIPELINE
+        **cache_kwargs: Passed through to st.cache_data (ttl, show_spinner, ...)
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cached = st.cache_data(**cache_kwargs)(func)
+        key = (func.__module__, func.__qualname__)
+        _SCOPES.setdefault(scope, {})[key] = cached
+        return cached
+
+    return decorator
+
+
+def clear_scope(scope: str) -> int:
+    """
+    Clear every cached function registered under scope.
+
+    Returns:
+        Number of cached functions cleared
+    """
+    functions = _SCOPES.get(scope, {})
+    for cached in functions.values():
+        cached.clear()
+    return len(functions)
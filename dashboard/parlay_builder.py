@@ -321,8 +321,10 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from dashboard.cache_scopes import PIPELINE, scoped_cache_data
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+
+@scoped_cache_data(PIPELINE, ttl=300)  # Cache for 5 minutes
 def fetch_live_odds():
     """Fetch real NFL odds from The Odds API."""
     try:
@@ -19,7 +19,7 @@ setup(
         "nflreadpy>=0.1.0",
         "polars>=0.20.0",
         "pandas>=2.0.0",
-        "pyarrow>=12.0.0",
+        "pyarrow>=14.0.0",
         "numpy>=1.24.0",  # Python 3.13+ uses numpy 2.x
         "xgboost>=2.0.0",
         "scikit-learn>=1.3.0",
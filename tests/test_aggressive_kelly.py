@@ -0,0 +1,206 @@
+"""Tests for aggressive Kelly bet sizing."""
+
+import numpy as np
+import pytest
+
+from agents.aggressive_kelly import (
+    WEATHER_CODES,
+    AggressiveKellyCalculator,
+    KellyResult,
+    kelly_batch,
+)
+
+
+def test_slam_dunk_is_capped():
+    """Test a max-confidence bet is capped at max_bet_pct."""
+    calc = AggressiveKellyCalculator(bankroll=10000)
+
+    result = calc.calculate_bet_size(
+        edge=0.18,
+        confidence=0.87,
+        situational_edge=0.11,
+        weather_confidence="VERY HIGH",
+        recent_performance={"win_rate": 0.60, "max_drawdown": -0.10},
+    )
+
+    assert result["bet_size"] == pytest.approx(1000.0)
+    assert result["bet_pct"] == pytest.approx(0.10)
+    assert result["tier"] == "S - SLAM DUNK"
+
+
+def test_emergency_stop_on_drawdown():
+    """Test severe drawdown zeroes the bet."""
+    calc = AggressiveKellyCalculator(bankroll=10000)
+
+    result = calc.calculate_bet_size(
+        edge=0.18,
+        confidence=0.87,
+        recent_performance={"win_rate": 0.60, "max_drawdown": -0.30},
+    )
+
+    assert result["multiplier"] == 0.0
+    assert result["bet_size"] == 0.0
+    assert result["tier"] == "D - SKIP"
+
+
+def test_batch_matches_scalar():
+    """Test batch sizing agrees with per-bet sizing."""
+    calc = AggressiveKellyCalculator(bankroll=10000)
+
+    edges = [0.18, 0.04, 0.02, 0.12, 0.07]
+    confidences = [0.87, 0.66, 0.59, 0.72, 0.76]
+    situational = [0.11, 0.0, 0.0, 0.06, 0.0]
+    weather = ["VERY HIGH", "MEDIUM", "LOW", "HIGH", "MEDIUM"]
+    perfs = [
+        {"win_rate": 0.60, "max_drawdown": -0.10},
+        {"win_rate": 0.54, "max_drawdown": -0.15},
+        {"win_rate": 0.51, "max_drawdown": -0.22},
+        None,
+        {"win_rate": 0.49, "max_drawdown": 0.0},
+    ]
+
+    batch = calc.calculate_bet_sizes_batch(
+        edges, confidences, situational, weather, perfs
+    )
+
+    for i in range(len(edges)):
+        single = calc.calculate_bet_size(
+            edges[i], confidences[i], situational[i], weather[i], perfs[i]
+        )
+        assert batch["bet_size"][i] == pytest.approx(single["bet_size"])
+        assert batch["multiplier"][i] == pytest.approx(single["multiplier"])
+        assert batch["tier"][i] == single["tier"]
+
+
+def test_batch_defaults():
+    """Test batch sizing works with only edges and confidences."""
+    calc = AggressiveKellyCalculator(bankroll=10000)
+
+    batch = calc.calculate_bet_sizes_batch(
+        np.array([0.05, 0.10]), np.array([0.70, 0.50])
+    )
+
+    assert batch["bet_size"].shape == (2,)
+    assert batch["bet_size"][1] == 0.0
+    assert batch["tier"][1] == "D - SKIP"
+
+
+def test_batch_empty():
+    """Test an empty batch returns empty arrays."""
+    calc = AggressiveKellyCalculator(bankroll=10000)
+
+    batch = calc.calculate_bet_sizes_batch([], [], [], [], [])
+
+    assert batch["bet_size"].shape == (0,)
+    assert len(batch["tier"]) == 0
+
+
+def test_tier_stats_ring_buffer():
+    """Test tier stats only cover bets still in the ring buffer."""
+    calc = AggressiveKellyCalculator(bankroll=10000, history_size=3)
+
+    calc.record_bet("A", 100.0, 90.0, True)
+    calc.record_bet("B", 50.0, -50.0, False)
+    calc.record_bet("A", 100.0, -100.0, False)
+    calc.record_bet("B", 50.0, 45.0, True)  # evicts the first "A" bet
+
+    stats = calc.get_tier_stats()
+
+    assert len(calc.recent_bets) == 3
+    assert calc.recent_bets[0]["tier"] == "B"
+    assert stats.loc["A", "count"] == 1
+    assert stats.loc["A", "win_rate"] == 0.0
+    assert stats.loc["B", "count"] == 2
+    assert stats.loc["B", "won"] == 1
+    assert stats.loc["B", "roi"] == pytest.approx(-5.0 / 100.0)
+
+
+def test_rolling_performance_window():
+    """Test incremental performance stats over the last 20 bets."""
+    calc = AggressiveKellyCalculator(bankroll=1000)
+
+    assert calc.current_performance is None
+
+    for _ in range(5):
+        calc.update_performance(False, -50.0)
+    for _ in range(20):
+        calc.update_performance(True, 20.0)
+
+    perf = calc.current_performance
+
+    # Only the last 20 (all wins) are in the window
+    assert perf["win_rate"] == 1.0
+    # Equity recovered past its old peak, so the drawdown episode reset
+    assert perf["max_drawdown"] == 0.0
+
+
+def test_recorded_performance_drives_governor():
+    """Test recorded results are used when no performance is passed."""
+    calc = AggressiveKellyCalculator(bankroll=1000)
+
+    for _ in range(3):
+        calc.update_performance(False, -100.0)
+
+    result = calc.calculate_bet_size(edge=0.18, confidence=0.87)
+
+    # 30% drawdown triggers the emergency stop
+    assert calc.current_performance["max_drawdown"] == pytest.approx(-0.30)
+    assert result["bet_size"] == 0.0
+
+
+def test_skip_reasoning():
+    """Test return_reasoning=False skips the explanation only."""
+    calc = AggressiveKellyCalculator(bankroll=10000)
+
+    full = calc.calculate_bet_size(edge=0.07, confidence=0.76)
+    bare = calc.calculate_bet_size(edge=0.07, confidence=0.76, return_reasoning=False)
+
+    assert bare["reasoning"] is None
+    assert full["reasoning"]
+    assert bare["bet_size"] == full["bet_size"]
+    assert bare["tier"] == full["tier"]
+
+
+def test_kelly_batch_matches_scalar():
+    """Test the compiled batch loop agrees with per-bet sizing."""
+    calc = AggressiveKellyCalculator(bankroll=10000)
+
+    edges = np.array([0.18, 0.04, 0.12])
+    confidences = np.array([0.87, 0.66, 0.72])
+    situational = np.array([0.11, 0.0, 0.06])
+    weather = ["VERY HIGH", "MEDIUM", "HIGH"]
+    perfs = [
+        {"win_rate": 0.60, "max_drawdown": -0.10},
+        None,
+        {"win_rate": 0.51, "max_drawdown": -0.22},
+    ]
+
+    batch = kelly_batch(
+        edges,
+        confidences,
+        situational,
+        np.array([WEATHER_CODES[w] for w in weather]),
+        np.array([p["win_rate"] if p else 0.0 for p in perfs]),
+        np.array([p["max_drawdown"] if p else 0.0 for p in perfs]),
+        np.array([p is not None for p in perfs]),
+        bankroll=10000,
+    )
+
+    for i in range(len(edges)):
+        single = calc.calculate_bet_size(
+            edges[i], confidences[i], situational[i], weather[i], perfs[i]
+        )
+        assert batch["bet_size"][i] == pytest.approx(single["bet_size"], abs=0.01)
+        assert batch["multiplier"][i] == pytest.approx(single["multiplier"])
+
+
+def test_kelly_result_access():
+    """Test KellyResult supports attribute and legacy dict-style access."""
+    calc = AggressiveKellyCalculator(bankroll=10000)
+
+    result = calc.calculate_bet_size(edge=0.07, confidence=0.76)
+
+    assert isinstance(result, KellyResult)
+    assert result["bet_size"] == result.bet_size
+    with pytest.raises(KeyError):
+        result["missing"]
@@ -0,0 +1,174 @@
+"""Tests for the API clients: Odds API fan-out and caching, nflverse downloads."""
+
+import json
+import os
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from agents import api_integrations
+from agents.api_integrations import NFLVerseAPI, TheOddsAPI
+
+
+def _odds_response(games, remaining="400", ok=True, status_code=200):
+    response = MagicMock(ok=ok, status_code=status_code, from_cache=False)
+    response.json.return_value = games
+    response.content = json.dumps(games).encode()
+    response.headers = {"x-requests-remaining": remaining, "x-requests-used": "100"}
+    return response
+
+
+def _game(game_id, book, market):
+    return {
+        "id": game_id,
+        "home_team": "Kansas City Chiefs",
+        "away_team": "Buffalo Bills",
+        "bookmakers": [
+            {"key": book, "title": book.title(), "markets": [{"key": market}]}
+        ],
+    }
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    monkeypatch.setattr(api_integrations, "HTTP_CACHE_DIR", tmp_path)
+    api = TheOddsAPI(api_key="test-key", use_cache=False)
+    api.session = MagicMock()
+    return api
+
+
+def test_multi_merges_markets_per_bookmaker(api):
+    """Test two responses for one game and bookmaker merge their markets."""
+    responses = {
+        "h2h": _odds_response([_game("g1", "draftkings", "h2h")]),
+        "spreads": _odds_response(
+            [_game("g1", "draftkings", "spreads"), _game("g2", "fanduel", "spreads")]
+        ),
+    }
+    api.session.get.side_effect = lambda url, params, timeout: responses[
+        params["markets"]
+    ]
+
+    games = {g["id"]: g for g in api.get_nfl_odds_multi(["h2h", "spreads"], ["us"])}
+
+    assert set(games) == {"g1", "g2"}
+    books = games["g1"]["bookmakers"]
+    assert len(books) == 1
+    assert sorted(m["key"] for m in books[0]["markets"]) == ["h2h", "spreads"]
+
+
+def test_multi_stops_at_low_quota(api, monkeypatch):
+    """Test a low x-requests-remaining stops requests other workers picked up."""
+    workers = 3
+    in_flight = threading.Barrier(workers, timeout=5)
+    quota_events = []
+    fetch_odds = api._fetch_odds
+
+    def spy(url, params, quota_low):
+        quota_events.append(quota_low)
+        return fetch_odds(url, params, quota_low)
+
+    def get(url, params, timeout):
+        in_flight.wait()
+        if params["markets"] == "h2h" and params["regions"] == "us":
+            return _odds_response([_game("g1", "draftkings", "h2h")], remaining="5")
+        # Still in flight when the quota ran low: answer only after it was seen
+        assert quota_events[0].wait(5)
+        return _odds_response([_game("g2", "fanduel", params["markets"])])
+
+    monkeypatch.setattr(api, "_fetch_odds", spy)
+    api.session.get.side_effect = get
+
+    games = api.get_nfl_odds_multi(
+        ["h2h", "spreads", "totals"], ["us", "us2"], max_workers=workers
+    )
+
+    # The first three requests were already sent and merged; the rest are skipped
+    assert api.session.get.call_count == workers
+    assert {g["id"] for g in games} == {"g1", "g2"}
+
+
+def test_multi_non_ok_returns_empty(api):
+    """Test a failed response yields no games instead of raising."""
+    api.session.get.return_value = _odds_response(
+        {"message": "quota"}, ok=False, status_code=429
+    )
+
+    assert api.get_nfl_odds_multi(["h2h"], ["us"]) == []
+
+
+def test_failed_fetch_serves_stale_cache(api):
+    """Test get_nfl_odds falls back to stale cached games on a failed request."""
+    stale = [_game("g1", "draftkings", "h2h")]
+    api.use_cache = True
+    api.cache = MagicMock()
+    api.cache.should_fetch_fresh.return_value = True
+    api.cache.get.side_effect = lambda key, max_age_minutes=None: (
+        {"data": {"games": stale}} if max_age_minutes == 240 else None
+    )
+    api.session.get.return_value = _odds_response([], ok=False, status_code=500)
+
+    assert api.get_nfl_odds() == stale
+
+
+def test_failed_fetch_without_cache_returns_empty(api):
+    """Test get_nfl_odds returns [] when the request fails and nothing is cached."""
+    api.session.get.return_value = _odds_response([], ok=False, status_code=500)
+
+    assert api.get_nfl_odds() == []
+
+
+class _February2025(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 2, 1)
+
+
+def _pbp_download(*chunks):
+    response = MagicMock()
+    response.__enter__.return_value = response
+
+    def iter_content(chunk_size):
+        for chunk in chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    response.iter_content.side_effect = iter_content
+    return MagicMock(return_value=response)
+
+
+@pytest.fixture
+def nflverse(tmp_path, monkeypatch):
+    monkeypatch.setattr(NFLVerseAPI, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(api_integrations, "datetime", _February2025)
+    return NFLVerseAPI()
+
+
+def test_pbp_current_season_refreshes_during_playoffs(nflverse, tmp_path, monkeypatch):
+    """Test the 2024 season is still re-downloaded daily in February 2025."""
+    for season in (2023, 2024):
+        path = tmp_path / f"play_by_play_{season}.parquet"
+        path.write_bytes(b"old")
+        two_days_ago = datetime(2025, 1, 30).timestamp()
+        os.utime(path, (two_days_ago, two_days_ago))
+    get = _pbp_download(b"new")
+    monkeypatch.setattr(api_integrations.requests, "get", get)
+
+    assert nflverse._pbp_path(2023).read_bytes() == b"old"
+    assert nflverse._pbp_path(2024).read_bytes() == b"new"
+    assert get.call_count == 1
+
+
+def test_pbp_failed_download_leaves_no_part_file(nflverse, tmp_path, monkeypatch):
+    """Test an interrupted download removes its partial file."""
+    get = _pbp_download(b"partial", requests.ConnectionError("reset"))
+    monkeypatch.setattr(api_integrations.requests, "get", get)
+
+    with pytest.raises(requests.ConnectionError):
+        nflverse._pbp_path(2024)
+
+    assert list(tmp_path.iterdir()) == []
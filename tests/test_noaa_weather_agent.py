@@ -0,0 +1,256 @@
+"""Tests for the NOAA weather agent."""
+
+import asyncio
+import io
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from urllib3.response import HTTPResponse
+
+from agents.noaa_weather_agent import NOAAWeatherAgent
+
+PERIODS = [
+    {
+        "startTime": "2024-12-01T06:00:00-06:00",
+        "endTime": "2024-12-01T18:00:00-06:00",
+        "name": "Today",
+    },
+    {
+        "startTime": "2024-12-02T00:00:00Z",
+        "endTime": "2024-12-02T12:00:00Z",
+        "name": "Tonight",
+    },
+]
+
+
+def test_find_closest_period():
+    """Test the period containing game time is chosen."""
+    agent = NOAAWeatherAgent()
+
+    game_time = datetime(2024, 12, 2, 3, 0, tzinfo=timezone.utc)
+
+    assert agent._find_closest_period(PERIODS, game_time)["name"] == "Tonight"
+
+
+def test_find_closest_period_outside_range():
+    """Test game times before/after all periods use the nearest end."""
+    agent = NOAAWeatherAgent()
+
+    before = datetime(2024, 11, 1, tzinfo=timezone.utc)
+    after = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    assert agent._find_closest_period(PERIODS, before)["name"] == "Today"
+    assert agent._find_closest_period(PERIODS, after)["name"] == "Tonight"
+
+
+def _noaa_response(payload):
+    response = MagicMock(status_code=200)
+    response.__enter__.return_value = response
+    response.json.return_value = payload
+    response.content = json.dumps(payload).encode()
+    response.raw = HTTPResponse(io.BytesIO(response.content), preload_content=False)
+    return response
+
+
+@pytest.fixture
+def gridpoint_cache(tmp_path, monkeypatch):
+    path = tmp_path / "gridpoints.json"
+    monkeypatch.setattr(NOAAWeatherAgent, "GRIDPOINT_CACHE_PATH", path)
+    return path
+
+
+def test_get_forecast_is_cached(gridpoint_cache):
+    """Test repeat forecasts for the same stadium/hour skip both HTTP hops."""
+    agent = NOAAWeatherAgent()
+    period = {
+        "startTime": "2024-12-01T06:00:00-06:00",
+        "endTime": "2024-12-01T18:00:00-06:00",
+        "temperature": 28,
+        "windSpeed": "10 to 15 mph",
+        "windDirection": "NW",
+        "shortForecast": "Snow",
+        "detailedForecast": "Snow likely.",
+    }
+    agent.session = MagicMock()
+    agent.session.get.side_effect = [
+        _noaa_response({"properties": {"forecast": "https://example/forecast"}}),
+        _noaa_response({"properties": {"periods": [period]}}),
+    ]
+
+    game_time = datetime(2024, 12, 1, 12, 0, tzinfo=timezone.utc)
+    first = agent.get_forecast(44.5013, -88.0622, game_time)
+    second = agent.get_forecast(44.5013, -88.0622, game_time.replace(minute=25))
+
+    assert first["wind_speed"] == 15
+    assert second == first
+    assert agent.session.get.call_count == 2
+
+
+def test_get_stadium_location():
+    """Test team lookup returns the stadium with its name."""
+    agent = NOAAWeatherAgent()
+
+    stadium = agent.get_stadium_location("GB")
+
+    assert stadium["name"] == "Lambeau Field"
+    assert stadium["lat"] == 44.5013
+    assert agent.get_stadium_location("XXX") is None
+
+
+def test_weather_edge_batch_matches_scalar():
+    """Test batch weather edge agrees with the per-game calculation."""
+    agent = NOAAWeatherAgent()
+    weather = pd.DataFrame(
+        {
+            "wind_speed": [5, 12, 15, 20, 25, 14],
+            "temperature": [70, 29, 19, 45, 10, 30],
+            "precipitation_probability": [0, 80, 61, 60, 90, 10],
+            "confidence": ["HIGH", "HIGH", "LOW", "HIGH", "HIGH", "LOW"],
+        }
+    )
+
+    batch = agent.calculate_weather_edge_batch(weather, np.full(len(weather), 45.0))
+
+    for i, row in weather.iterrows():
+        single = agent.calculate_weather_edge(row.to_dict(), market_total=45.0)
+        for key, value in single.items():
+            if isinstance(value, str):
+                assert batch.loc[i, key] == value
+            else:
+                assert batch.loc[i, key] == pytest.approx(value)
+
+
+def test_parse_wind():
+    """Test NOAA wind strings parse to the upper bound of the range."""
+    agent = NOAAWeatherAgent()
+    winds = ["10 mph", "5 to 10 mph", "10 to 15 MPH", "Calm"]
+
+    assert [agent._parse_wind(w) for w in winds] == [10, 10, 15, 8]
+    assert agent.parse_wind_series(pd.Series(winds)).tolist() == [10, 10, 15, 8]
+
+
+def test_gridpoint_cache_persists(gridpoint_cache):
+    """Test resolved forecast URLs are reused by a new agent."""
+    agent = NOAAWeatherAgent()
+    agent.session = MagicMock()
+    agent.session.get.return_value = _noaa_response(
+        {"properties": {"forecast": "https://example/forecast"}}
+    )
+
+    assert agent._get_forecast_url(44.501, -88.062) == "https://example/forecast"
+
+    restarted = NOAAWeatherAgent()
+    restarted.session = MagicMock()
+
+    assert restarted._get_forecast_url(44.501, -88.062) == "https://example/forecast"
+    restarted.session.get.assert_not_called()
+
+
+def test_get_forecast_naive_time_and_null_precip(gridpoint_cache):
+    """Test naive kickoff times and null precipitation don't force a fallback."""
+    agent = NOAAWeatherAgent()
+    period = {
+        "startTime": "2024-12-01T06:00:00-06:00",
+        "endTime": "2024-12-01T18:00:00-06:00",
+        "temperature": 40,
+        "windSpeed": "5 mph",
+        "windDirection": "S",
+        "shortForecast": "Sunny",
+        "detailedForecast": "Sunny.",
+        "probabilityOfPrecipitation": {"value": None},
+    }
+    agent.session = MagicMock()
+    agent.session.get.side_effect = [
+        _noaa_response({"properties": {"forecast": "https://example/forecast"}}),
+        _noaa_response({"properties": {"periods": [period]}}),
+    ]
+
+    forecast = agent.get_forecast(44.5013, -88.0622, datetime(2024, 12, 1, 12, 0))
+
+    assert forecast["source"] == "NOAA"
+    assert forecast["precipitation_probability"] == 0
+
+
+def test_get_nearest_stadium():
+    """Test nearest-stadium lookup from arbitrary coordinates."""
+    agent = NOAAWeatherAgent()
+
+    # Milwaukee is closer to Soldier Field than to Lambeau
+    assert agent.get_nearest_stadium(43.04, -87.91)["team"] == "CHI"
+    assert agent.get_nearest_stadium(42.33, -83.05)["roof"] == "dome"
+    assert agent.STADIUM_ARRAYS.is_dome.sum() == 1
+
+
+def test_read_game_period_streams():
+    """Test streamed and fully parsed forecasts pick the same period."""
+    agent = NOAAWeatherAgent()
+    payload = {"properties": {"periods": PERIODS}}
+
+    for game_time in [
+        datetime(2024, 11, 1, tzinfo=timezone.utc),
+        datetime(2024, 12, 1, 20, 0, tzinfo=timezone.utc),
+        datetime(2024, 12, 2, 3, 0, tzinfo=timezone.utc),
+        datetime(2025, 1, 1, tzinfo=timezone.utc),
+    ]:
+        streamed = agent._read_game_period(_noaa_response(payload), game_time)
+        assert streamed == agent._find_closest_period(PERIODS, game_time)
+
+
+def test_fallback_forecast_is_a_copy():
+    """Test callers can't mutate the shared fallback forecast."""
+    agent = NOAAWeatherAgent()
+
+    forecast = agent._fallback_forecast(0.0, 0.0)
+    forecast["temperature"] = 10
+
+    assert agent._fallback_forecast(0.0, 0.0)["temperature"] == 55
+    assert forecast["source"] == "FALLBACK"
+
+
+def test_get_slate_weather_keeps_order():
+    """Test slate weather returns one result per game, in input order."""
+    agent = NOAAWeatherAgent()
+    kickoff = datetime(2024, 12, 1, 18, 0, tzinfo=timezone.utc)
+
+    results = agent.get_slate_weather([("DET", kickoff), ("XXX", kickoff)])
+
+    assert results[0]["is_dome"] is True
+    assert results[1] == {"error": "Stadium not found"}
+
+
+def test_get_slate_weather_async():
+    """Test the async slate wrapper matches the threaded version."""
+    agent = NOAAWeatherAgent()
+    kickoff = datetime(2024, 12, 1, 18, 0, tzinfo=timezone.utc)
+    games = [("DET", kickoff), ("XXX", kickoff)]
+
+    results = asyncio.run(agent.get_slate_weather_async(games))
+
+    assert results == agent.get_slate_weather(games)
+
+
+def test_runs_as_script(tmp_path):
+    """Test `python agents/noaa_weather_agent.py` imports and runs its demo."""
+    script = Path(__file__).resolve().parent.parent / "agents" / "noaa_weather_agent.py"
+    # Unreachable proxy: the demo falls back without touching the network
+    env = dict(os.environ, HOME=str(tmp_path), HTTPS_PROXY="http://127.0.0.1:9")
+
+    result = subprocess.run(
+        [sys.executable, str(script)],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "NOAA WEATHER AGENT TEST" in result.stdout
@@ -0,0 +1,97 @@
+"""Tests for the xAI Grok agent."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from agents.xai_grok_agent import GrokAgent
+
+
+def _fake_chat(messages, model="grok-2-1212", temperature=0.0, stream=False):
+    """Echo the user prompt back, failing for Jets games."""
+    content = messages[-1]["content"]
+    if "Jets" in content:
+        return {}
+    return {"choices": [{"message": {"content": content.splitlines()[0]}}]}
+
+
+def test_analyze_slate_keeps_order():
+    """Test slate analysis returns one result per game, in input order."""
+    grok = GrokAgent(api_key="test")
+    games = [
+        {"home_team": "Chiefs", "away_team": "Bills"},
+        {"home_team": "Jets", "away_team": "Dolphins"},
+        {"home_team": "Bears", "away_team": "Packers", "odds": {"total": 41.5}},
+    ]
+
+    with patch.object(grok, "chat", side_effect=_fake_chat):
+        analyses = grok.analyze_slate(games)
+
+    assert analyses == [
+        "Analyze this NFL game: Bills @ Chiefs",
+        "Unable to get Grok analysis",
+        "Analyze this NFL game: Packers @ Bears",
+    ]
+
+
+def test_chat_many_empty():
+    """Test chat_many with no requests sends nothing."""
+    grok = GrokAgent(api_key="test")
+
+    assert grok.chat_many([]) == []
+
+
+def test_chat_encodes_payload():
+    """Test chat posts the JSON payload and decodes the response body."""
+    grok = GrokAgent(api_key="test")
+    messages = [{"role": "user", "content": "Wind 18 mph at Soldier Field"}]
+    grok.session = MagicMock()
+    grok.session.post.return_value.content = b'{"choices": []}'
+
+    assert grok.chat(messages) == {"choices": []}
+
+    body = json.loads(grok.session.post.call_args.kwargs["data"])
+    assert body["messages"] == messages
+    assert body["temperature"] == 0.0
+
+
+def test_chat_caches_deterministic_requests():
+    """Test identical temperature-0 chats hit the API once."""
+    grok = GrokAgent(api_key="test")
+    messages = [{"role": "user", "content": "Fade the Jets?"}]
+    grok.session = MagicMock()
+    grok.session.post.return_value.content = b'{"choices": []}'
+
+    grok.chat(messages)
+    grok.chat(messages)
+    grok.chat(messages, temperature=0.7)
+
+    assert grok.session.post.call_count == 2
+
+
+def test_prepare_posts_dedupes_and_truncates():
+    """Test sentiment posts are deduplicated, truncated, and capped."""
+    grok = GrokAgent(api_key="test")
+    posts = ["Chiefs -3 lock", "chiefs  -3 LOCK", "x" * 500] + [
+        f"post {i}" for i in range(30)
+    ]
+
+    prepared = grok._prepare_posts(posts)
+
+    assert prepared[0] == "Chiefs -3 lock"
+    assert prepared[1] == "x" * 280
+    assert len(prepared) == 20
+
+
+def test_prediction_prompt():
+    """Test the templated prediction prompt lists every feature in order."""
+    grok = GrokAgent(api_key="test")
+    features = {"elo_diff": 42.5, "home_epa": -0.1, "weird{key}": None}
+
+    with patch.object(grok, "chat", return_value={}) as chat:
+        grok.predict_with_reasoning("Chiefs", "Bills", features)
+
+    prompt = chat.call_args.args[0][-1]["content"]
+    assert prompt.startswith(
+        "\nNFL Game Prediction: Bills @ Chiefs\n\nKey Metrics:\n"
+        "elo_diff: 42.5\nhome_epa: -0.1\nweird{key}: None\n\nProvide:\n"
+    )